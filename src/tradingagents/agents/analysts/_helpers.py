@@ -0,0 +1,161 @@
+import re
+from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.messages import AIMessage, AnyMessage, BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableSequence
+
+from tradingagents.llm import ChatModel
+from tradingagents.config import peek_config
+from tradingagents.agents.prompts import load_prompt
+from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.tool_registry import (
+    AnalystType,
+    get_analyst_tools,
+    get_analyst_tool_names,
+)
+
+# Mirrors the signal extractor's canonical-line tolerance (case, spacing,
+# optional bold) so a proposal it would accept also stops the analysts.
+# Compiled once at import; the per-call cost is a single linear scan.
+_FINAL_PROPOSAL_PATTERN = re.compile(
+    r"FINAL\s+TRANSACTION\s+PROPOSAL\s*:\s*(?:\*\*)?\s*(?:BUY|SELL|HOLD)", re.IGNORECASE
+)
+
+# bind_tools re-serialises every tool schema, and several graphs in one
+# process (backtests, notebooks) bind the same tool set to the same model.
+# Entries keep the model alive, so the cache is a small LRU rather than
+# unbounded; the stored model is compared by identity so a recycled id()
+# can never return another model's binding.
+_BOUND_LLM_CACHE_SIZE = 32
+_bound_llm_cache: OrderedDict[
+    tuple[int, AnalystType], tuple[ChatModel, Runnable[Any, BaseMessage]]
+] = OrderedDict()
+_bound_llm_lock = threading.Lock()
+
+
+def _bind_analyst_tools(llm: ChatModel, analyst_type: AnalystType) -> Runnable[Any, BaseMessage]:
+    """Return `llm` bound to the analyst's registered tools, reusing earlier bindings."""
+    key = (id(llm), analyst_type)
+    with _bound_llm_lock:
+        cached = _bound_llm_cache.get(key)
+        if cached is not None and cached[0] is llm:
+            _bound_llm_cache.move_to_end(key)
+            return cached[1]
+        bound = llm.bind_tools(list(get_analyst_tools(analyst_type)))
+        _bound_llm_cache[key] = (llm, bound)
+        while len(_bound_llm_cache) > _BOUND_LLM_CACHE_SIZE:
+            _bound_llm_cache.popitem(last=False)
+        return bound
+
+
+def _skip_after_final_proposal() -> bool:
+    """Return the configured short-circuit flag, defaulting to disabled."""
+    config = peek_config()
+    return config is not None and config.skip_analysts_after_final_proposal
+
+
+def _has_final_proposal(messages: list[AnyMessage]) -> bool:
+    """Check whether the latest AI message already carries the team's stop signal.
+
+    Only AI messages count: a tool result or news article quoting the
+    phrase is data, not a proposal from the team.
+
+    Block-shaped content is searched one text block at a time and stops at
+    the first hit, rather than joining every block (tool results, thinking
+    traces) into one string first. The proposal is a single line, so it
+    always sits inside one block.
+    """
+    if not messages or not isinstance(messages[-1], AIMessage):
+        return False
+    content = messages[-1].content
+    if isinstance(content, str):
+        return _FINAL_PROPOSAL_PATTERN.search(content) is not None
+    search = _FINAL_PROPOSAL_PATTERN.search
+    for item in content:
+        text = item.get("text") if isinstance(item, dict) else item
+        if isinstance(text, str) and search(text) is not None:
+            return True
+    return False
+
+
+def _static_system_message(system_text: str, llm: ChatModel) -> SystemMessage:
+    """Wrap the analyst's static instructions as a literal system message.
+
+    Providers cache by prompt prefix, so the static block must be
+    byte-identical across calls and must not contain per-run values. For
+    Anthropic the block is additionally marked with an ephemeral
+    `cache_control` breakpoint; OpenAI and Gemini cache prefixes
+    automatically.
+    """
+    if isinstance(llm, ChatAnthropic):
+        return SystemMessage(
+            content=[{"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}]
+        )
+    return SystemMessage(content=system_text)
+
+
+def make_analyst_node(
+    analyst_type: AnalystType, prompt_name: str, report_field: str, llm: ChatModel
+) -> Callable[[AgentState], dict[str, Any]]:
+    """Build the LangGraph node for one of the tool-calling analysts.
+
+    The prompt template, the rendered tool names, the tool-bound LLM and the
+    chain joining them depend only on the analyst type, so they are built
+    once here instead of on every node call. The system prompt is split
+    into a static block (instructions and tool names) followed by a short
+    `analyst_context` block carrying `current_date` and `ticker`, which
+    keeps the cacheable prefix identical across tickers and dates.
+
+    When `skip_analysts_after_final_proposal` is enabled and the latest AI
+    message already contains a `FINAL TRANSACTION PROPOSAL` line, the node
+    returns an empty update instead of calling the LLM; the report field is
+    not written, so an earlier report is never blanked.
+
+    Args:
+        analyst_type: Key into the analyst tool registry, e.g. `"market"`.
+        prompt_name: Name of the system prompt file under `prompts/`.
+        report_field: `AgentState` field the final report is written to.
+        llm: ChatModel used to generate the analysis.
+
+    Returns:
+        A LangGraph node callable conforming to
+        `(state: AgentState) -> dict[str, Any]`.
+    """
+    system_text = load_prompt(prompt_name).format(tool_names=get_analyst_tool_names(analyst_type))
+    prompt = ChatPromptTemplate.from_messages([
+        _static_system_message(system_text, llm),
+        ("system", load_prompt("analyst_context", append_language=False)),
+        MessagesPlaceholder(variable_name="messages"),
+    ])
+    chain = RunnableSequence(prompt, _bind_analyst_tools(llm, analyst_type))
+    skip_after_final = _skip_after_final_proposal()
+
+    def analyst_node(state: AgentState) -> dict[str, Any]:
+        messages = state.messages
+        if skip_after_final and _has_final_proposal(messages):
+            return {"messages": []}
+
+        result = chain.invoke({
+            "messages": messages,
+            "current_date": state.trade_date,
+            "ticker": state.company_of_interest,
+        })
+
+        if result.tool_calls:
+            return {"messages": [result], report_field: ""}
+
+        # Reasoning-enabled providers return content blocks (thinking + text);
+        # only the text blocks form the report.
+        report = result.content
+        if isinstance(report, list):
+            report = "".join(
+                item.get("text", "") if isinstance(item, dict) else str(item) for item in report
+            )
+        return {"messages": [result], report_field: report}
+
+    return analyst_node
@@ -1,6 +1,7 @@
 from pathlib import Path
+import functools
 
-from tradingagents.config import get_config
+from tradingagents.config import peek_config
 
 _PROMPT_DIR = Path(__file__).parent
 
@@ -23,24 +24,39 @@ def _response_language() -> str:
         str: The response language BCP 47 tag, defaults to "en-US" if
         configuration is unavailable.
     """
-    try:
-        return get_config().response_language
-    except RuntimeError:
-        return "en-US"
+    config = peek_config()
+    return "en-US" if config is None else config.response_language
 
 
-def _language_instruction() -> str:
+@functools.cache
+def _language_instruction(language: str) -> str:
     """Generate the language instruction string to append to prompts.
 
+    Args:
+        language (str): The configured response language tag.
+
     Returns:
         str: The language instruction string to be appended to prompts.
     """
-    language = _response_language().strip() or "en-US"
+    language = language.strip() or "en-US"
     language = language.replace("{", "{{").replace("}", "}}")
     return f"\n\nPlease respond in {language}."
 
 
-def load_prompt(name: str) -> str:
+@functools.cache
+def _read_template(name: str) -> str:
+    """Read a prompt file once and expand the canonical-signal marker.
+
+    Debate, trader and manager nodes call :func:`load_prompt` on every
+    turn; the packaged templates never change at runtime, so the file read
+    and marker substitution are done once per template. The response
+    language is appended per call because it follows the active config.
+    """
+    text = (_PROMPT_DIR / f"{name}.md").read_text(encoding="utf-8")
+    return text.replace(_CANONICAL_SIGNAL_MARKER, _CANONICAL_SIGNAL_NOTICE)
+
+
+def load_prompt(name: str, *, append_language: bool = True) -> str:
     """Load a prompt template from the prompts directory.
 
     Returns the raw string with `{placeholder}` markers so callers can
@@ -50,10 +66,13 @@ def load_prompt(name: str) -> str:
     - `{{require_canonical_signal}}` (opt-in marker) is replaced with
       the centralised BUY/SELL/HOLD-in-English notice so the wording stays
       consistent across the trader / research-manager / risk-manager prompts.
-    - The configured response language is appended as a final line.
+    - The configured response language is appended as a final line unless
+      `append_language` is False (used for short fragments that are sent
+      alongside a prompt which already carries the instruction).
 
     Args:
         name (str): The name of the prompt template file to load (without .md extension).
+        append_language (bool): Whether to append the response-language instruction.
 
     Returns:
         str: The loaded prompt template content with language instructions appended.
@@ -61,6 +80,7 @@ def load_prompt(name: str) -> str:
     Raises:
         FileNotFoundError: If the prompt template file does not exist.
     """
-    text = (_PROMPT_DIR / f"{name}.md").read_text(encoding="utf-8")
-    text = text.replace(_CANONICAL_SIGNAL_MARKER, _CANONICAL_SIGNAL_NOTICE)
-    return text + _language_instruction()
+    text = _read_template(name)
+    if not append_language:
+        return text
+    return text + _language_instruction(_response_language())
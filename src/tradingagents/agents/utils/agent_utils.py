@@ -1,35 +1,60 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
+import importlib
 from collections.abc import Callable
 
 from langchain_core.messages import HumanMessage, RemoveMessage
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
 
 from tradingagents.agents.utils.agent_states import AgentState
-from tradingagents.agents.utils.tool_registry import (
-    ANALYST_TOOL_REGISTRY,
-    get_analyst_tools,
-    get_analyst_tool_names,
-)
-from tradingagents.agents.utils.news_data_tools import (
-    get_news,
-    get_global_news,
-    get_market_context,
-    get_earnings_calendar,
-    get_insider_transactions,
-)
-
-# Re-export tools for convenience
-from tradingagents.agents.utils.core_stock_tools import get_stock_data
-from tradingagents.agents.utils.fundamental_data_tools import (
-    get_cashflow,
-    get_fundamentals,
-    get_balance_sheet,
-    get_short_interest,
-    get_analyst_ratings,
-    get_dividends_splits,
-    get_income_statement,
-    get_institutional_holders,
-)
-from tradingagents.agents.utils.technical_indicators_tools import get_indicators
+
+if TYPE_CHECKING:
+    from tradingagents.agents.utils.tool_registry import (
+        ANALYST_TOOL_REGISTRY,
+        get_analyst_tools,
+        get_analyst_tool_names,
+    )
+    from tradingagents.agents.utils.news_data_tools import (
+        get_news,
+        get_global_news,
+        get_market_context,
+        get_earnings_calendar,
+        get_insider_transactions,
+    )
+    from tradingagents.agents.utils.core_stock_tools import get_stock_data
+    from tradingagents.agents.utils.fundamental_data_tools import (
+        get_cashflow,
+        get_fundamentals,
+        get_balance_sheet,
+        get_short_interest,
+        get_analyst_ratings,
+        get_dividends_splits,
+        get_income_statement,
+        get_institutional_holders,
+    )
+    from tradingagents.agents.utils.technical_indicators_tools import get_indicators
+
+# Tool re-exports are resolved lazily (PEP 562) so importing this module for
+# `create_msg_delete` does not pull in every dataflow module.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ANALYST_TOOL_REGISTRY": "tradingagents.agents.utils.tool_registry",
+    "get_analyst_tools": "tradingagents.agents.utils.tool_registry",
+    "get_analyst_tool_names": "tradingagents.agents.utils.tool_registry",
+    "get_news": "tradingagents.agents.utils.news_data_tools",
+    "get_global_news": "tradingagents.agents.utils.news_data_tools",
+    "get_market_context": "tradingagents.agents.utils.news_data_tools",
+    "get_earnings_calendar": "tradingagents.agents.utils.news_data_tools",
+    "get_insider_transactions": "tradingagents.agents.utils.news_data_tools",
+    "get_stock_data": "tradingagents.agents.utils.core_stock_tools",
+    "get_cashflow": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_fundamentals": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_balance_sheet": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_short_interest": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_analyst_ratings": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_dividends_splits": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_income_statement": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_institutional_holders": "tradingagents.agents.utils.fundamental_data_tools",
+    "get_indicators": "tradingagents.agents.utils.technical_indicators_tools",
+}
 
 __all__ = [
     "ANALYST_TOOL_REGISTRY",
@@ -53,6 +78,24 @@ __all__ = [
     "get_stock_data",
 ]
 
+# The remove-all sentinel carries a fixed id and is never mutated by the
+# reducer, so one validated instance is shared by every Msg Clear node.
+_REMOVE_ALL = RemoveMessage(id=REMOVE_ALL_MESSAGES)
+
+
+def __getattr__(name: str) -> object:
+    """Import a re-exported tool on first access and cache it on the module."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 def create_msg_delete() -> Callable[[AgentState], dict[str, Any]]:
     """Create a function that deletes messages from the agent state.
@@ -66,15 +109,22 @@ def create_msg_delete() -> Callable[[AgentState], dict[str, Any]]:
     def delete_messages(state: AgentState) -> dict[str, Any]:
         """Clear messages and add placeholder for Anthropic compatibility.
 
+        Uses the `add_messages` bulk-removal sentinel so clearing a long
+        history costs one `RemoveMessage` instead of one per message.
+
         Args:
             state (AgentState): The current state of the agent.
 
         Returns:
-            dict[str, Any]: A dictionary containing the 'messages' key with a list
-                of RemoveMessage operations and a placeholder HumanMessage.
+            dict[str, Any]: A dictionary containing the 'messages' key with a
+                remove-all operation (when there is history) and a placeholder
+                HumanMessage.
         """
-        removal_operations = [RemoveMessage(id=m.id) for m in state.messages]
+        # A fresh placeholder per clear: add_messages assigns its id in place,
+        # and each clear's "Continue" must stay a distinct message.
         placeholder = HumanMessage(content="Continue")
-        return {"messages": [*removal_operations, placeholder]}
+        if not state.messages:
+            return {"messages": [placeholder]}
+        return {"messages": [_REMOVE_ALL, placeholder]}
 
     return delete_messages
@@ -3,9 +3,11 @@ from typing import Annotated
 from langchain_core.tools import tool
 
 from tradingagents.dataflows.yfinance import get_yfin_data_online
+from tradingagents.agents.utils.tool_cache import tool_value_cache
 
 
 @tool
+@tool_value_cache(as_of_arg="end_date")
 def get_stock_data(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
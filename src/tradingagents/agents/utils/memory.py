@@ -1,5 +1,6 @@
 import re
 import json
+import heapq
 from typing import TypedDict
 import logging
 from pathlib import Path
@@ -41,7 +42,7 @@ class FinancialSituationMemory(BaseModel):
         title="Storage Path",
         description=(
             "Optional JSONL file. When set, the memory is loaded from disk on "
-            "construction and rewritten on every add_situations call so "
+            "construction and every add_situations batch is appended to it so "
             "reflections persist across process boundaries."
         ),
     )
@@ -93,24 +94,63 @@ class FinancialSituationMemory(BaseModel):
             self._rebuild_index()
             logger.info("Loaded %d memories from %s", loaded, path)
 
+    @staticmethod
+    def _encode_lines(pairs: list[tuple[str, str]]) -> str:
+        """Serialise `(situation, recommendation)` pairs as JSONL text."""
+        return "".join(
+            json.dumps(
+                {"situation": situation, "recommendation": recommendation}, ensure_ascii=False
+            )
+            + "\n"
+            for situation, recommendation in pairs
+        )
+
+    def _append_to_disk(self, pairs: list[tuple[str, str]]) -> None:
+        """Append one batch of pairs to `storage_path` with a single write.
+
+        A backtest reflects after every decision date, so rewriting the whole
+        file per batch grew quadratically with the memory size. Only the new
+        lines are written while the file holds exactly one complete line per
+        earlier document. Otherwise (first save, a line torn by a crash
+        mid-append, records edited or dropped on disk) the file is rewritten
+        atomically by :meth:`_save_to_disk` from the in-memory documents.
+        """
+        path = self.storage_path
+        if path is None:
+            return
+        if not path.exists():
+            self._save_to_disk()
+            return
+        with path.open("a+b") as fp:
+            fp.seek(0)
+            stored = fp.read()
+            expected = len(self.documents) - len(pairs)
+            in_sync = stored.count(b"\n") == expected and stored[-1:] in (b"", b"\n")
+            if in_sync:
+                fp.write(self._encode_lines(pairs).encode("utf-8"))
+        if not in_sync:
+            logger.warning("Memory file %s is out of sync; rewriting it", path)
+            self._save_to_disk()
+
     def _save_to_disk(self) -> None:
-        """Atomically rewrite `storage_path` from in-memory documents."""
+        """Atomically rewrite `storage_path` from in-memory documents.
+
+        The parent directory is only created when opening the temp file
+        reports it missing instead of issuing a `mkdir` before every save.
+        """
         path = self.storage_path
         if path is None:
             return
-        path.parent.mkdir(parents=True, exist_ok=True)
         tmp = path.with_suffix(path.suffix + ".tmp")
-        with tmp.open("w", encoding="utf-8") as fp:
-            for situation, recommendation in zip(
-                self.documents, self.recommendations, strict=True
-            ):
-                fp.write(
-                    json.dumps(
-                        {"situation": situation, "recommendation": recommendation},
-                        ensure_ascii=False,
-                    )
-                    + "\n"
-                )
+        try:
+            handle = tmp.open("w", encoding="utf-8")
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = tmp.open("w", encoding="utf-8")
+        with handle as fp:
+            fp.write(
+                self._encode_lines(list(zip(self.documents, self.recommendations, strict=True)))
+            )
         tmp.replace(path)
 
     def _rebuild_index(self) -> None:
@@ -130,7 +170,7 @@ class FinancialSituationMemory(BaseModel):
             self.documents.append(situation)
             self.recommendations.append(recommendation)
         self._rebuild_index()
-        self._save_to_disk()
+        self._append_to_disk(situations_and_advice)
 
     def get_memories(self, current_situation: str, n_matches: int = 1) -> list[MemoryMatch]:
         """Return the top `n_matches` recommendations by BM25 lexical similarity.
@@ -149,7 +189,9 @@ class FinancialSituationMemory(BaseModel):
         scores = self.bm25.get_scores(_tokenize(current_situation))
         peak = max(scores)
         max_score = peak if peak > 0 else 1.0
-        top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n_matches]
+        # Bounded top-k selection: O(n log k) instead of sorting every score.
+        # Ties keep insertion order, exactly like the stable sorted()[:k].
+        top_indices = heapq.nlargest(n_matches, range(len(scores)), key=scores.__getitem__)
         return [
             MemoryMatch(
                 matched_situation=self.documents[idx],
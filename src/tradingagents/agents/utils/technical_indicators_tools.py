@@ -3,9 +3,11 @@ from typing import Annotated
 from langchain_core.tools import tool
 
 from tradingagents.dataflows.yfinance import get_stock_stats_indicators_batch
+from tradingagents.agents.utils.tool_cache import tool_value_cache
 
 
 @tool
+@tool_value_cache(as_of_arg="curr_date")
 def get_indicators(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[
@@ -41,9 +43,10 @@ def get_indicators(
             unsupported, or no market data is available for the symbol.
     """
     if isinstance(indicator, str):
-        indicators = [ind.strip() for ind in indicator.split(",") if ind.strip()]
+        stripped = (ind.strip() for ind in indicator.split(","))
     else:
-        indicators = [ind.strip() for ind in indicator if ind and ind.strip()]
+        stripped = (ind.strip() for ind in indicator if ind)
+    indicators = [ind for ind in stripped if ind]
 
     if not indicators:
         raise ValueError("At least one indicator must be provided.")
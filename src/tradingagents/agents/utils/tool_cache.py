@@ -0,0 +1,154 @@
+import time
+import inspect
+from pathlib import Path
+import datetime
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from tradingagents.config import peek_config
+
+_TOOL_ERROR_PREFIX = "[TOOL_ERROR]"
+
+# Windows that end before today are immutable market history; anything
+# touching today can still change intraday.
+HISTORICAL_TTL_SECONDS = 24 * 60 * 60
+RECENT_TTL_SECONDS = 60
+_MAX_ENTRIES = 4096
+_CACHED_MARKER = "__tool_value_cached__"
+
+_registered_caches: list[OrderedDict[tuple[object, ...], tuple[float, str]]] = []
+
+
+def _freeze(value: object) -> object:
+    """Convert list arguments (e.g. indicator lists) into hashable tuples."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _cache_scope() -> Path | None:
+    """Return the active data cache directory, or None when no config is set.
+
+    Tool results are derived from that directory's history files, so two
+    configs in one process must never see each other's cached strings.
+    """
+    config = peek_config()
+    return None if config is None else config.data_cache_dir
+
+
+def _ttl_for(as_of: str) -> float:
+    """Pick the TTL for a result whose data window ends on `as_of` (YYYY-MM-DD)."""
+    try:
+        as_of_date = datetime.date.fromisoformat(as_of)
+    except (TypeError, ValueError):
+        return RECENT_TTL_SECONDS
+    if as_of_date < datetime.date.today():
+        return HISTORICAL_TTL_SECONDS
+    return RECENT_TTL_SECONDS
+
+
+def _argument_resolver(
+    signature: inspect.Signature,
+) -> Callable[[tuple[object, ...], dict[str, object]], tuple[object, ...]]:
+    """Build a function mapping `(args, kwargs)` to every parameter's value in order."""
+    params = tuple(signature.parameters.values())
+    names = tuple(param.name for param in params)
+    defaults = {param.name: param.default for param in params if param.default is not param.empty}
+    plain = all(param.kind is param.POSITIONAL_OR_KEYWORD for param in params)
+
+    def resolve(args: tuple[object, ...], kwargs: dict[str, object]) -> tuple[object, ...]:
+        if plain and len(args) <= len(names):
+            values = list(args)
+            used = 0
+            for name in names[len(args) :]:
+                if name in kwargs:
+                    values.append(kwargs[name])
+                    used += 1
+                elif name in defaults:
+                    values.append(defaults[name])
+                else:
+                    break
+            else:
+                if used == len(kwargs):
+                    return tuple(values)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple(bound.arguments.values())
+
+    return resolve
+
+
+def tool_value_cache(as_of_arg: str) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Memoise a string-returning tool function with a freshness-aware TTL.
+
+    Analysts frequently repeat identical tool calls (same ticker and date)
+    within a run and across runs in the same process. Entries are scoped to
+    the active config's data cache directory. The wrapped function
+    keeps its signature and docstring, so it can sit directly under
+    LangChain's `@tool` decorator without changing the LLM-visible schema.
+    `[TOOL_ERROR]` results and exceptions are never cached.
+
+    This is the only cache of formatted tool output; the yfinance layer
+    below it keeps just the resolved price history, under the same
+    historical/recent TTL split.
+
+    Parameter names and defaults are resolved once at decoration time, so a
+    call is keyed without `inspect.Signature.bind`; binding is only used as
+    the fallback for signatures or calls the fast path does not cover (it
+    also raises the usual `TypeError`). Decorating an already-wrapped
+    function returns it unchanged instead of stacking a second cache.
+
+    Args:
+        as_of_arg: Name of the argument holding the last date of the data
+            window; it selects the 24h historical TTL or the 60s recent TTL.
+
+    Returns:
+        A decorator that wraps the tool function with the cache.
+    """
+
+    def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        if getattr(func, _CACHED_MARKER, False):
+            return func
+        signature = inspect.signature(func)
+        call_values = _argument_resolver(signature)
+        names = tuple(signature.parameters)
+        as_of_index = names.index(as_of_arg) if as_of_arg in names else None
+        entries: OrderedDict[tuple[object, ...], tuple[float, str]] = OrderedDict()
+        _registered_caches.append(entries)
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> str:
+            values = call_values(args, kwargs)
+            key = (_cache_scope(), *(_freeze(value) for value in values))
+            now = time.monotonic()
+            with lock:
+                cached = entries.get(key)
+                if cached is not None and cached[0] > now:
+                    entries.move_to_end(key)
+                    return cached[1]
+
+            result = func(*args, **kwargs)
+            if result.startswith(_TOOL_ERROR_PREFIX):
+                return result
+
+            ttl = _ttl_for("" if as_of_index is None else str(values[as_of_index]))
+            with lock:
+                entries[key] = (now + ttl, result)
+                entries.move_to_end(key)
+                while len(entries) > _MAX_ENTRIES:
+                    entries.popitem(last=False)
+            return result
+
+        setattr(wrapper, _CACHED_MARKER, True)
+        return wrapper
+
+    return decorator
+
+
+def clear_tool_value_caches() -> None:
+    """Drop every memoised tool result (e.g. between tests or after a data refresh)."""
+    for entries in _registered_caches:
+        entries.clear()
@@ -46,6 +46,12 @@ ANALYST_TOOL_REGISTRY: dict[AnalystType, tuple[BaseTool, ...]] = {
     ),
 }
 
+# The registry is static, so the prompt-facing name lists are rendered once.
+_ANALYST_TOOL_NAMES: dict[AnalystType, str] = {
+    analyst_type: ", ".join(tool.name for tool in tools)
+    for analyst_type, tools in ANALYST_TOOL_REGISTRY.items()
+}
+
 
 def get_analyst_tools(analyst_type: AnalystType) -> tuple[BaseTool, ...]:
     """Return the registered tool tuple for `analyst_type`."""
@@ -54,4 +60,4 @@ def get_analyst_tools(analyst_type: AnalystType) -> tuple[BaseTool, ...]:
 
 def get_analyst_tool_names(analyst_type: AnalystType) -> str:
     """Return a comma-separated tool-name string for prompt partials."""
-    return ", ".join(tool.name for tool in get_analyst_tools(analyst_type))
+    return _ANALYST_TOOL_NAMES[analyst_type]
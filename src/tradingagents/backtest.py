@@ -30,6 +30,7 @@ import math
 from typing import Any, Literal
 import logging
 from datetime import datetime, timedelta
+from collections import Counter
 from collections.abc import Callable  # noqa: TC003  # runtime needed for Backtester.run signature
 
 import pandas as pd
@@ -42,7 +43,7 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from tradingagents.config import (
     TradingAgentsConfig,  # noqa: TC001  # Pydantic field annotation needs runtime resolution
 )
-from tradingagents.dataflows.yfinance import _resolve_history_with_cache
+from tradingagents.dataflows.yfinance import _history_dates, _resolve_history_with_cache
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.graph.signal_processing import TradeRecommendation
 
@@ -375,15 +376,12 @@ def _exit_price_after_horizon(
     """Return `(exit_date, exit_close)` `horizon_days` bars after decision."""
     if history.empty or "Date" not in history.columns or "Close" not in history.columns:
         return None, None
-    dates = pd.to_datetime(history["Date"])
-    decision_ts = pd.Timestamp(decision_date)
-    future_mask = dates > decision_ts
-    future = history.loc[future_mask].reset_index(drop=True)
-    if future.empty:
+    dates = _history_dates(history)
+    first_future = dates.searchsorted(pd.Timestamp(decision_date), side="right")
+    if first_future == len(dates):
         return None, None
-    target_idx = min(horizon_days - 1, len(future) - 1)
-    row = future.iloc[target_idx]
-    return pd.Timestamp(row["Date"]).strftime("%Y-%m-%d"), float(row["Close"])
+    target_idx = min(first_future + horizon_days - 1, len(dates) - 1)
+    return dates[target_idx].strftime("%Y-%m-%d"), float(history["Close"].iloc[target_idx])
 
 
 def _entry_price_on(history: pd.DataFrame, decision_date: str) -> tuple[str | None, float | None]:
@@ -394,13 +392,11 @@ def _entry_price_on(history: pd.DataFrame, decision_date: str) -> tuple[str | No
     """
     if history.empty or "Date" not in history.columns or "Close" not in history.columns:
         return None, None
-    dates = pd.to_datetime(history["Date"])
-    decision_ts = pd.Timestamp(decision_date)
-    eligible = history.loc[dates >= decision_ts].reset_index(drop=True)
-    if eligible.empty:
+    dates = _history_dates(history)
+    entry_idx = dates.searchsorted(pd.Timestamp(decision_date), side="left")
+    if entry_idx == len(dates):
         return None, None
-    row = eligible.iloc[0]
-    return pd.Timestamp(row["Date"]).strftime("%Y-%m-%d"), float(row["Close"])
+    return dates[entry_idx].strftime("%Y-%m-%d"), float(history["Close"].iloc[entry_idx])
 
 
 def _signed_return(
@@ -439,31 +435,44 @@ def _aggregate_report(
             estimated_cost_usd=cost_usd,
         )
 
-    returns = [t.realised_return for t in trades]
-    mean = sum(returns) / len(returns)
-    variance = sum((r - mean) ** 2 for r in returns) / max(len(returns) - 1, 1)
-    stdev = math.sqrt(variance) if variance > 0 else 0.0
-    periods = _periods_per_year(frequency)
-    sharpe = (mean / stdev) * math.sqrt(periods) if stdev > 0 else float("nan")
-
-    profitable = [r for r in returns if r > 0]
-    losing = [r for r in returns if r < 0]
-    hit_rate = len(profitable) / len(returns) if returns else float("nan")
-    avg_win = sum(profitable) / len(profitable) if profitable else 0.0
-    avg_loss = sum(losing) / len(losing) if losing else 0.0
-    expectancy = hit_rate * avg_win + (1 - hit_rate) * avg_loss
-
+    # One ordered pass collects the returns, the win/loss sums, the
+    # compounded drawdown and the signal counts; only the variance needs a
+    # second pass over the returns once the mean is known.
+    returns: list[float] = []
+    win_total = loss_total = 0.0
+    n_wins = n_losses = 0
+    signal_counts: Counter[str] = Counter()
     # Worst drawdown is the maximum peak-to-trough decline of the
     # cumulative compounded return series.
     cumulative = 1.0
     peak = 1.0
     worst_dd = 0.0
-    for r in returns:
+    for trade in trades:
+        r = trade.realised_return
+        returns.append(r)
+        signal_counts[trade.recommendation.signal] += 1
+        if r > 0:
+            win_total += r
+            n_wins += 1
+        elif r < 0:
+            loss_total += r
+            n_losses += 1
         cumulative *= 1.0 + r
         peak = max(peak, cumulative)
         if peak > 0:
             worst_dd = min(worst_dd, cumulative / peak - 1.0)
 
+    mean = sum(returns) / len(returns)
+    variance = sum((r - mean) ** 2 for r in returns) / max(len(returns) - 1, 1)
+    stdev = math.sqrt(variance) if variance > 0 else 0.0
+    periods = _periods_per_year(frequency)
+    sharpe = (mean / stdev) * math.sqrt(periods) if stdev > 0 else float("nan")
+
+    hit_rate = n_wins / len(returns)
+    avg_win = win_total / n_wins if n_wins else 0.0
+    avg_loss = loss_total / n_losses if n_losses else 0.0
+    expectancy = hit_rate * avg_win + (1 - hit_rate) * avg_loss
+
     return BacktestReport(
         trades=trades,
         sharpe=sharpe,
@@ -472,9 +481,9 @@ def _aggregate_report(
         avg_trade_return=mean,
         worst_drawdown=worst_dd,
         total_return=cumulative - 1.0,
-        n_buy=sum(1 for t in trades if t.recommendation.signal == "BUY"),
-        n_sell=sum(1 for t in trades if t.recommendation.signal == "SELL"),
-        n_hold=sum(1 for t in trades if t.recommendation.signal == "HOLD"),
+        n_buy=signal_counts["BUY"],
+        n_sell=signal_counts["SELL"],
+        n_hold=signal_counts["HOLD"],
         estimated_cost_usd=cost_usd,
     )
 
@@ -531,17 +540,18 @@ class Backtester(BaseModel):
             trades: list[TradeRecord] = []
             stop = False
 
+            base_graph = TradingAgentsGraph(config=cfg.trading_config, callbacks=[cost_tracker])
             for ticker in cfg.tickers:
                 if stop:
                     break
-                # New TradingAgentsGraph per ticker: it carries mutable
-                # per-run state (`self.ticker`, `self.log_states_dict`
-                # keyed only by date), and reusing one instance would let
-                # ticker A's state leak into ticker B's on-disk log file
-                # when both runs land on the same decision_date. Memory
-                # JSONLs are shared via disk regardless, so per-ticker
-                # construction is cheap and isolation-safe.
-                graph = TradingAgentsGraph(config=cfg.trading_config, callbacks=[cost_tracker])
+                # Fresh per-run state per ticker: the graph carries mutable
+                # state (`self.ticker`, `self.log_states_dict` keyed only by
+                # date), and reusing one instance would let ticker A's state
+                # leak into ticker B's on-disk log file when both runs land
+                # on the same decision_date. `fork()` resets that state and
+                # rebuilds the memories and workflow; only the stateless LLM
+                # clients and tool nodes are shared across tickers.
+                graph = base_graph.fork()
                 for decision_date in grid:
                     if stop:
                         break
@@ -1,8 +1,9 @@
 from typing import Literal
 from pathlib import Path
+import functools
 from contextvars import ContextVar
 
-from pydantic import Field, BaseModel, computed_field
+from pydantic import Field, BaseModel, ConfigDict, computed_field
 
 from tradingagents.llm import LLMProvider, ReasoningEffort
 
@@ -18,8 +19,22 @@ ResponseLanguage = Literal[
 _DEFAULT_RESULTS_DIR = Path("./results")
 
 
+@functools.cache
+def _data_cache_dir(results_dir: Path) -> Path:
+    """Return `<results_dir>/data_cache`, built once per results directory."""
+    return results_dir / "data_cache"
+
+
 class TradingAgentsConfig(BaseModel):
-    """Configuration for the TradingAgents framework."""
+    """Configuration for the TradingAgents framework.
+
+    Instances are frozen: :func:`get_config` hands the registered instance
+    to every caller without copying, so no caller can change settings for
+    the others. Derive a variant with `model_copy(update=...)` and register
+    it with :func:`set_config` instead.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     results_dir: Path = Field(
         default=_DEFAULT_RESULTS_DIR,
@@ -77,6 +92,25 @@ class TradingAgentsConfig(BaseModel):
         title="Max Risk Discussion Rounds",
         description="Maximum number of risk management debate rounds",
     )
+    parallel_analysts: bool = Field(
+        default=False,
+        title="Parallel Analysts",
+        description=(
+            "Run the selected analysts concurrently, each with a private "
+            "message thread, instead of one after another. Analyst reports "
+            "are unchanged, but their intermediate tool-calling messages are "
+            "no longer streamed to the console."
+        ),
+    )
+    skip_analysts_after_final_proposal: bool = Field(
+        default=False,
+        title="Skip Analysts After Final Proposal",
+        description=(
+            "Opt-in: return an empty analyst update without calling the LLM "
+            "when the latest AI message already carries a `FINAL TRANSACTION "
+            "PROPOSAL` line. The analyst's report is left untouched."
+        ),
+    )
     max_recur_limit: int = Field(
         ...,
         ge=30,
@@ -102,8 +136,7 @@ class TradingAgentsConfig(BaseModel):
         Returns:
             Path: Directory used for caching downloaded market and news data.
         """
-        data_cache_dir = self.results_dir / "data_cache"
-        return data_cache_dir
+        return _data_cache_dir(self.results_dir)
 
 
 _active_config: ContextVar[TradingAgentsConfig | None] = ContextVar(
@@ -124,6 +157,36 @@ def set_config(config: TradingAgentsConfig) -> None:
     _active_config.set(config)
 
 
+def peek_config() -> TradingAgentsConfig | None:
+    """Return the active TradingAgentsConfig, or None when none is registered.
+
+    For callers with a built-in default (prompt language, analyst
+    short-circuit) that are hit on every node call; unlike
+    :func:`get_config` it never raises, so the unconfigured path (tests,
+    notebooks building single nodes) avoids an exception per call.
+
+    Returns:
+        TradingAgentsConfig | None: The active configuration, if any.
+    """
+    return _active_config.get()
+
+
+def get_cache_dir() -> Path:
+    """Return the active configuration's data cache directory.
+
+    Dataflow helpers need only this one setting on every call; the `Path`
+    is built once per results directory. The directory itself is created
+    by the graph and by the cache writers, not here.
+
+    Returns:
+        Path: The data cache directory of the active configuration.
+
+    Raises:
+        RuntimeError: If the TradingAgentsConfig has not been initialized yet.
+    """
+    return get_config().data_cache_dir
+
+
 def get_config() -> TradingAgentsConfig:
     """Return the active TradingAgentsConfig (set by TradingAgentsGraph).
 
@@ -1,3 +1,4 @@
+import re
 import logging
 from datetime import datetime
 import contextlib
@@ -13,20 +14,16 @@ from tradingagents.dataflows.tickers import (
     describe_symbol_candidates,
     get_yfinance_symbol_candidates,
 )
+from tradingagents.dataflows.yfinance import _parse_yyyy_mm_dd
 
 logger = logging.getLogger(__name__)
 
 _GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl={hl}&gl={gl}&ceid={ceid}"
 _TOOL_ERROR_PREFIX = "[TOOL_ERROR]"
 _NO_DATA_PREFIX = "[NO_DATA]"
-
-
-def _parse_yyyy_mm_dd(value: str, field_name: str) -> datetime:
-    """Parse a YYYY-MM-DD date string with a clear error."""
-    try:
-        return datetime.strptime(value, "%Y-%m-%d")
-    except ValueError as exc:
-        raise ValueError(f"{field_name} must be in YYYY-MM-DD format: {value!r}") from exc
+# Article blocks start with a `##` heading; matching past leading whitespace
+# avoids copying a multi-kilobyte news payload just to test its prefix.
+_ARTICLES_HEADING = re.compile(r"\s*##")
 
 
 def _parse_pub_date(value: object) -> datetime | None:
@@ -159,9 +156,12 @@ def _get_news_yfinance(ticker: str, start_date: str, end_date: str) -> str:
     if start_dt > end_dt:
         raise ValueError(f"start_date must be on or before end_date: {start_date} > {end_date}")
 
-    news_str = ""
+    # Article lines are collected in a list and joined once; growing one
+    # string with += re-copies everything written so far per line.
+    parts: list[str] = []
     filtered_count = 0
     skipped_undated = 0
+    window_end = end_dt + relativedelta(days=1)
 
     for article in news:
         data = _extract_article_data(article)
@@ -171,16 +171,16 @@ def _get_news_yfinance(ticker: str, start_date: str, end_date: str) -> str:
             skipped_undated += 1
             continue
         pub_date_naive = pub_date.replace(tzinfo=None)
-        if not (start_dt <= pub_date_naive < end_dt + relativedelta(days=1)):
+        if not (start_dt <= pub_date_naive < window_end):
             continue
 
-        news_str += f"### {data['title']} (source: {data['publisher']})\n"
-        news_str += f"Published: {pub_date_naive.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"### {data['title']} (source: {data['publisher']})\n")
+        parts.append(f"Published: {pub_date_naive.strftime('%Y-%m-%d %H:%M:%S')}\n")
         if data["summary"]:
-            news_str += f"{data['summary']}\n"
+            parts.append(f"{data['summary']}\n")
         if data["link"]:
-            news_str += f"Link: {data['link']}\n"
-        news_str += "\n"
+            parts.append(f"Link: {data['link']}\n")
+        parts.append("\n")
         filtered_count += 1
 
     if filtered_count == 0:
@@ -191,6 +191,7 @@ def _get_news_yfinance(ticker: str, start_date: str, end_date: str) -> str:
             f"Skipped {skipped_undated} undated articles to avoid lookahead bias.)"
         )
 
+    news_str = "".join(parts)
     return f"## {resolved_ticker} News (yfinance), from {start_date} to {end_date}:\n\n{news_str}"
 
 
@@ -252,22 +253,23 @@ def get_news_google_rss(ticker: str, start_date: str, end_date: str, limit: int
     if not entries:
         return f"{_NO_DATA_PREFIX} No Google News results for {ticker}"
 
-    news_str = ""
+    parts: list[str] = []
     kept = 0
+    window_end = end_dt + relativedelta(days=1)
     for entry in entries:
         pub_date = _entry_pub_date(entry)
         if pub_date is None:
             continue
-        if not (start_dt <= pub_date < end_dt + relativedelta(days=1)):
+        if not (start_dt <= pub_date < window_end):
             continue
         title = getattr(entry, "title", "(no title)")
         link = getattr(entry, "link", "")
         publisher = _entry_publisher(entry)
-        news_str += f"### {title} (source: {publisher})\n"
-        news_str += f"Published: {pub_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"### {title} (source: {publisher})\n")
+        parts.append(f"Published: {pub_date.strftime('%Y-%m-%d %H:%M:%S')}\n")
         if link:
-            news_str += f"Link: {link}\n"
-        news_str += "\n"
+            parts.append(f"Link: {link}\n")
+        parts.append("\n")
         kept += 1
         if kept >= limit:
             break
@@ -278,6 +280,7 @@ def get_news_google_rss(ticker: str, start_date: str, end_date: str, limit: int
             f"{start_date} and {end_date}"
         )
 
+    news_str = "".join(parts)
     return f"## {ticker} News (Google News RSS), from {start_date} to {end_date}:\n\n{news_str}"
 
 
@@ -291,8 +294,8 @@ def fetch_news(ticker: str, start_date: str, end_date: str) -> str:
     yf_result = get_news_yfinance(ticker, start_date, end_date)
     rss_result = get_news_google_rss(ticker, start_date, end_date)
 
-    yf_has_articles = yf_result.lstrip().startswith("##")
-    rss_has_articles = rss_result.lstrip().startswith("##")
+    yf_has_articles = _ARTICLES_HEADING.match(yf_result) is not None
+    rss_has_articles = _ARTICLES_HEADING.match(rss_result) is not None
 
     if yf_has_articles and rss_has_articles:
         return yf_result + "\n\n---\n\n" + rss_result
@@ -321,14 +324,15 @@ def _format_article_to_str(article: dict) -> str:
     summary = data["summary"]
     pub_date = data["pub_date"]
 
-    result = f"### {title} (source: {publisher})\n"
+    parts = [f"### {title} (source: {publisher})\n"]
     if pub_date:
-        result += f"Published: {pub_date.replace(tzinfo=None).strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"Published: {pub_date.replace(tzinfo=None).strftime('%Y-%m-%d %H:%M:%S')}\n")
     if summary:
-        result += f"{summary}\n"
+        parts.append(f"{summary}\n")
     if link:
-        result += f"Link: {link}\n"
-    return result + "\n"
+        parts.append(f"Link: {link}\n")
+    parts.append("\n")
+    return "".join(parts)
 
 
 def _collect_global_news(
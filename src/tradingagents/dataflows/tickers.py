@@ -1,5 +1,6 @@
 import logging
 from functools import lru_cache
+from collections.abc import Sequence
 
 import yfinance as yf
 
@@ -165,12 +166,12 @@ def get_yfinance_symbol_candidates(symbol: str) -> list[str]:
     return _dedupe_symbols(tuple(candidates))
 
 
-def describe_symbol_candidates(symbol: str, candidates: list[str]) -> str:
+def describe_symbol_candidates(symbol: str, candidates: Sequence[str]) -> str:
     """Format attempted Yahoo Finance symbols for user-facing tool output.
 
     Args:
         symbol (str): The original symbol queried.
-        candidates (list[str]): The list of candidates attempted.
+        candidates (Sequence[str]): The candidates attempted.
 
     Returns:
         str: A comma-separated string of candidates or the single matching symbol.
@@ -1,14 +1,23 @@
+import re
+import math
+import time
 from typing import Annotated
 import logging
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import operator
+import functools
+import threading
+from collections import OrderedDict
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pandas as pd
 import yfinance as yf
-from stockstats import wrap
+from stockstats import StockDataFrame, wrap
 from dateutil.relativedelta import relativedelta
 
-from tradingagents.config import get_config
+from tradingagents.config import get_cache_dir
 from tradingagents.dataflows.tickers import (
     get_news_locale,
     describe_symbol_candidates,
@@ -22,10 +31,29 @@ _ANNUAL_REPORTING_LAG_DAYS = 90
 _NO_DATA_PREFIX = "[NO_DATA]"
 
 
+_ISO_DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD string; memoised because a run re-parses the same few dates."""
+    match = _ISO_DATE_PATTERN.fullmatch(value)
+    if match is not None:
+        return datetime(int(match[1]), int(match[2]), int(match[3]))
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
 def _parse_yyyy_mm_dd(value: str, field_name: str) -> datetime:
-    """Parse a YYYY-MM-DD date string with a field-specific error."""
+    """Parse a YYYY-MM-DD date string with a field-specific error.
+
+    Every tool call parses several dates, and a run or backtest repeats the
+    same handful many times, so results are memoised (datetimes are
+    immutable). Zero-padded input (what the LLM and the graph send) is
+    matched by a precompiled pattern and built directly; anything else
+    falls back to `strptime`, which also accepts unpadded months and days.
+    """
     try:
-        return datetime.strptime(value, "%Y-%m-%d")
+        return _parse_iso_date(value)
     except ValueError as exc:
         raise ValueError(f"{field_name} must be in YYYY-MM-DD format: {value!r}") from exc
 
@@ -54,10 +82,46 @@ def _as_of_datetime(curr_date: str | None) -> datetime | None:
     return _parse_yyyy_mm_dd(curr_date, "curr_date")
 
 
+@functools.lru_cache(maxsize=1)
+def _format_epoch_second(epoch_second: int) -> str:
+    """Format a whole epoch second as local `YYYY-MM-DD HH:MM:SS`."""
+    return datetime.fromtimestamp(epoch_second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _retrieved_at() -> str:
+    """Return the local timestamp for `# Data retrieved on:` headers.
+
+    Every tool result carries this header, and a parallel tool round emits
+    many within the same second; the formatted string is reused until the
+    second rolls over.
+    """
+    return _format_epoch_second(int(time.time()))
+
+
+@functools.lru_cache(maxsize=256)
+def _is_before_day(curr_date: str, today_ordinal: int) -> bool:
+    """Return whether `curr_date` falls before the day with ordinal `today_ordinal`."""
+    return _as_of_datetime(curr_date).toordinal() < today_ordinal
+
+
 def _is_historical_date(curr_date: str | None) -> bool:
-    """Return whether curr_date is before today's local date."""
-    as_of = _as_of_datetime(curr_date)
-    return as_of is not None and as_of.date() < datetime.now().date()
+    """Return whether curr_date is before today's local date.
+
+    Most tools ask this on every call with the same handful of dates; the
+    answer is memoised per calendar day, so the key rolls over at midnight.
+    """
+    return curr_date is not None and _is_before_day(curr_date, date.today().toordinal())
+
+
+@functools.lru_cache(maxsize=256)
+def _history_window(curr_date_dt: datetime) -> tuple[datetime, str, str]:
+    """Return the 15-year download window for `curr_date` as `(start, start_str, end_str)`.
+
+    yfinance's `end=` is exclusive, so the end is `curr_date + 1d`.
+    """
+    start_dt = (pd.Timestamp(curr_date_dt) - pd.DateOffset(years=15)).to_pydatetime()
+    end_dt = curr_date_dt + timedelta(days=1)
+    return start_dt, start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
 
 
 def _financial_statement_cutoff(curr_date: str | None, freq: str) -> pd.Timestamp | None:
@@ -150,15 +214,67 @@ def _humanize_number(value: object) -> str:
 _CACHE_FRESH_HOURS = 12
 
 
+# Parquet keeps column dtypes (no CSV tokenising or date re-parsing) and is
+# several times smaller on disk, but needs pyarrow; without it the cache
+# stays CSV.
+_HISTORY_CACHE_SUFFIX = ".parquet" if importlib.util.find_spec("pyarrow") is not None else ".csv"
+
+
+def _history_cache_file(cache_dir: Path, candidate: str) -> Path:
+    """Return the history cache file to read for `candidate`.
+
+    Prefers the `_HISTORY_CACHE_SUFFIX` file; when that does not exist yet
+    but a legacy CSV cache does, the CSV is returned so it can be reused
+    (and migrated) instead of re-downloading 15 years of history.
+    """
+    preferred = cache_dir / f"{candidate}-YFin-data{_HISTORY_CACHE_SUFFIX}"
+    if _HISTORY_CACHE_SUFFIX != ".csv" and not preferred.exists():
+        legacy = preferred.with_suffix(".csv")
+        if legacy.exists():
+            return legacy
+    return preferred
+
+
 def _read_cached_history(data_file: Path) -> pd.DataFrame:
-    """Read a cached yfinance history CSV."""
-    candidate_data = pd.read_csv(data_file)
-    candidate_data["Date"] = pd.to_datetime(candidate_data["Date"])
+    """Read a cached yfinance history file (Parquet, or CSV with dates parsed)."""
+    if data_file.suffix == ".parquet":
+        candidate_data = pd.read_parquet(data_file)
+    else:
+        candidate_data = pd.read_csv(data_file, parse_dates=["Date"])
     if candidate_data["Date"].dt.tz is not None:
         candidate_data["Date"] = candidate_data["Date"].dt.tz_localize(None)
     return candidate_data
 
 
+# A single worker keeps cache writes off the tool-call path while still
+# serialising them, so two parallel tool calls never race on one file.
+_cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yfin-cache")
+
+
+def _write_cached_history(data_file: Path, data: pd.DataFrame) -> None:
+    """Write a history cache file atomically so readers never see a partial file.
+
+    The cache directory is created here, on the background writer, rather
+    than with a `mkdir` on every history lookup; readers only need
+    `exists()` checks, which a missing directory answers correctly.
+    """
+    tmp_file = data_file.with_name(f"{data_file.name}.tmp")
+    try:
+        data_file.parent.mkdir(parents=True, exist_ok=True)
+        if data_file.suffix == ".parquet":
+            data.to_parquet(tmp_file, index=False, compression="zstd")
+        else:
+            data.to_csv(tmp_file, index=False)
+        tmp_file.replace(data_file)
+    except Exception:
+        logger.warning("Failed to write cache file %s", data_file, exc_info=True)
+
+
+def flush_history_cache_writes() -> None:
+    """Block until every queued history cache write has reached disk."""
+    _cache_writer.submit(lambda: None).result()
+
+
 def _download_history(candidate: str, start_date: str, end_date: str) -> pd.DataFrame:
     """Download split- and dividend-adjusted OHLCV history for a symbol.
 
@@ -205,6 +321,17 @@ def _cache_covers_window(
     )
 
 
+def _history_dates(data: pd.DataFrame) -> pd.DatetimeIndex:
+    """Return the history's `Date` column as a tz-naive DatetimeIndex.
+
+    Resolved histories are in ascending date order, so callers locate a
+    window with `searchsorted` (a binary search) instead of comparing every
+    bar of a 15-year frame through a full-length boolean mask.
+    """
+    dates = pd.DatetimeIndex(data["Date"])
+    return dates.tz_localize(None) if dates.tz is not None else dates
+
+
 def _is_cache_fresh(data_file: Path, curr_date_dt: datetime) -> bool:
     """Return whether the on-disk cache should be reused for `curr_date`.
 
@@ -221,6 +348,58 @@ def _is_cache_fresh(data_file: Path, curr_date_dt: datetime) -> bool:
     return age < timedelta(hours=_CACHE_FRESH_HOURS)
 
 
+def _cache_has_settled_window(
+    cached: pd.DataFrame, start_dt: datetime, last_required_dt: datetime
+) -> bool:
+    """Return whether `cached` covers the window and its `curr_date` bar is final.
+
+    A bar is final once a later bar exists or its day is already over, so
+    a cache like that is reused even when it is past its freshness age:
+    there is nothing a download could add for this window.
+    """
+    if not _cache_covers_window(cached, start_dt, last_required_dt):
+        return False
+    last_bar = pd.to_datetime(cached["Date"]).max()
+    return last_bar > pd.Timestamp(last_required_dt) or last_required_dt.date() < date.today()
+
+
+def _extend_cached_history(
+    candidate: str, cached: pd.DataFrame, start_dt: datetime, end_date: str
+) -> pd.DataFrame:
+    """Append the bars missing from `cached` instead of re-downloading 15 years.
+
+    Only the tail from the second-to-last cached bar onwards is fetched: the
+    last cached bar may have been written intraday and is replaced, while
+    the settled bar before it anchors the splice. Prices are split- and
+    dividend-adjusted, so a corporate action since the cache was written
+    rescales the whole history; when the anchor close no longer matches,
+    an empty frame is returned and the caller falls back to a full download.
+    """
+    if len(cached) < 2 or not {"Date", "Close"}.issubset(cached.columns):
+        return pd.DataFrame()
+    dates = pd.to_datetime(cached["Date"])
+    if dates.min() > pd.Timestamp(start_dt):
+        return pd.DataFrame()
+    anchor = dates.iloc[-2]
+    if anchor >= pd.Timestamp(end_date):
+        return pd.DataFrame()
+    tail = _download_history(candidate, anchor.strftime("%Y-%m-%d"), end_date)
+    if tail.empty or not set(cached.columns).issubset(tail.columns):
+        return pd.DataFrame()
+    tail_dates = pd.to_datetime(tail["Date"])
+    if tail_dates.dt.tz is not None:
+        tail_dates = tail_dates.dt.tz_localize(None)
+    anchor_close = tail.loc[tail_dates == anchor, "Close"]
+    if anchor_close.empty or not math.isclose(
+        float(anchor_close.iloc[0]), float(cached["Close"].iloc[-2]), rel_tol=1e-6
+    ):
+        return pd.DataFrame()
+    tail = tail.loc[tail_dates >= anchor, list(cached.columns)].assign(
+        Date=tail_dates[tail_dates >= anchor]
+    )
+    return pd.concat([cached.loc[dates < anchor], tail], ignore_index=True)
+
+
 def _load_history_candidate(  # noqa: PLR0913 -- mix of paths + dates + freshness is intentional
     candidate: str,
     data_file: Path,
@@ -238,72 +417,79 @@ def _load_history_candidate(  # noqa: PLR0913 -- mix of paths + dates + freshnes
     `[start_dt, last_required_dt]` inclusively; partial coverage falls
     back to a fresh download (using the exclusive `end_date` string
     yfinance expects) that overwrites the file with the wider window.
+    The overwrite is queued on a background writer and lands atomically.
+    A usable legacy CSV is rewritten once in the preferred cache format.
+
+    A cache whose `curr_date` bar is already final is reused as-is, even
+    when stale; bars after `curr_date` are dropped by the callers. Otherwise
+    a stale or short cache that already reaches back to `start_dt` is
+    extended with only the missing recent bars (see
+    :func:`_extend_cached_history`) before falling back to a full download.
     """
-    candidate_data = pd.DataFrame()
-    if fresh:
+    cached = pd.DataFrame()
+    if data_file.exists():
         try:
-            candidate_data = _read_cached_history(data_file)
+            cached = _read_cached_history(data_file)
         except Exception:
             logger.warning("Ignoring unreadable cache file %s", data_file, exc_info=True)
-            candidate_data = pd.DataFrame()
-        if not candidate_data.empty and not _cache_covers_window(
-            candidate_data, start_dt, last_required_dt
-        ):
+
+    candidate_data = pd.DataFrame()
+    if _cache_has_settled_window(cached, start_dt, last_required_dt):
+        candidate_data = cached
+    elif fresh and not cached.empty:
+        if _cache_covers_window(cached, start_dt, last_required_dt):
+            candidate_data = cached
+        else:
             logger.info(
                 "Cache for %s does not cover %s..%s; refreshing.", candidate, start_date, end_date
             )
-            candidate_data = pd.DataFrame()
 
+    target_file = data_file.with_suffix(_HISTORY_CACHE_SUFFIX)
     if candidate_data.empty:
-        candidate_data = _download_history(candidate, start_date, end_date)
+        candidate_data = _extend_cached_history(candidate, cached, start_dt, end_date)
+        if candidate_data.empty:
+            candidate_data = _download_history(candidate, start_date, end_date)
         if not candidate_data.empty:
-            candidate_data.to_csv(data_file, index=False)
+            _cache_writer.submit(_write_cached_history, target_file, candidate_data.copy())
+    elif target_file != data_file:
+        _cache_writer.submit(_write_cached_history, target_file, candidate_data.copy())
 
     return candidate_data
 
 
-def _resolve_history_with_cache(
-    symbol: str, curr_date_dt: datetime
-) -> tuple[str, pd.DataFrame, list[str]]:
-    """Fetch (or load cached) 15-year OHLCV history for `symbol`.
-
-    The resulting DataFrame is shared between :func:`get_yfin_data_online`
-    (which slices it by request window) and :func:`_get_stock_stats_bulk`
-    (which feeds it through stockstats), so a single download per ticker
-    services every market-analyst tool call.
-
-    The cache filename is ticker-only (`<TICKER>-YFin-data.csv`); the
-    requested `[curr_date - 15y, curr_date + 1d]` window is verified at
-    read time so adjacent run dates reuse the same on-disk file. Without
-    this, daily backtests would produce a new cache file per business day
-    and never benefit from cache reuse.
+# Parsing the on-disk history (and, on a miss, the freshness probe) costs
+# far more than formatting one tool result, and a single analyst round asks
+# for the same (ticker, date) history from several tools. Resolved frames
+# are kept in memory with the same freshness split as the tool caches;
+# callers treat the shared frame as read-only and copy before mutating.
+_HISTORICAL_HISTORY_TTL_SECONDS = 24 * 60 * 60
+_RECENT_HISTORY_TTL_SECONDS = 60
+_MAX_RESOLVED_HISTORIES = 64
+type _ResolvedHistory = tuple[str, pd.DataFrame, tuple[str, ...]]
+_resolved_histories: OrderedDict[tuple[str, str, Path], tuple[float, _ResolvedHistory]] = (
+    OrderedDict()
+)
+_pending_histories: dict[tuple[str, str, Path], Future[_ResolvedHistory]] = {}
+_resolved_histories_lock = threading.Lock()
 
-    Args:
-        symbol: User-supplied ticker symbol.
-        curr_date_dt: The reference date used to build the 15-y window
-            and decide whether the cache is still fresh.
 
-    Returns:
-        `(resolved_symbol, dataframe, candidate_list)`.
+def clear_history_cache() -> None:
+    """Drop every in-memory resolved history (the on-disk cache is untouched)."""
+    with _resolved_histories_lock:
+        _resolved_histories.clear()
+    with _wrapped_histories_lock:
+        _wrapped_histories.clear()
 
-    Raises:
-        ValueError: If no market data is found across all candidates.
-        RuntimeError: If every candidate raised on download.
-    """
-    config = get_config()
 
-    # yfinance's `end=` is exclusive, so download with curr_date+1d to
-    # actually include `curr_date` in the bar set. Coverage checks, in
-    # contrast, must compare against the latest *trading-day* we need
-    # back (curr_date itself), not the exclusive download end.
-    download_end_dt = curr_date_dt + timedelta(days=1)
+def _fetch_resolved_history(
+    symbol: str, curr_date_dt: datetime, cache_dir: Path
+) -> tuple[str, pd.DataFrame, list[str]]:
+    """Resolve `symbol` to the first candidate with history, reading or refreshing its cache."""
+    # The download end is exclusive (curr_date+1d) so `curr_date` is in the
+    # bar set. Coverage checks, in contrast, must compare against the latest
+    # *trading-day* we need back (curr_date itself), not the download end.
     last_required_dt = curr_date_dt
-    start_dt = (pd.Timestamp(curr_date_dt) - pd.DateOffset(years=15)).to_pydatetime()
-    start_date_str = pd.Timestamp(start_dt).strftime("%Y-%m-%d")
-    end_date_str = pd.Timestamp(download_end_dt).strftime("%Y-%m-%d")
-
-    cache_dir = Path(str(config.data_cache_dir))
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    start_dt, start_date_str, end_date_str = _history_window(curr_date_dt)
 
     candidates = get_yfinance_symbol_candidates(symbol)
     data = pd.DataFrame()
@@ -312,7 +498,7 @@ def _resolve_history_with_cache(
     fetched_any_candidate = False
 
     for candidate in candidates:
-        data_file = cache_dir / f"{candidate}-YFin-data.csv"
+        data_file = _history_cache_file(cache_dir, candidate)
         fresh = _is_cache_fresh(data_file, curr_date_dt)
         try:
             candidate_data = _load_history_candidate(
@@ -341,10 +527,94 @@ def _resolve_history_with_cache(
                 f"Failed to fetch market data for symbol '{symbol}' (tried: {tried})"
             ) from last_error
         raise ValueError(f"No market data found for symbol '{symbol}' (tried: {tried}).")
-
+    if not data["Date"].is_monotonic_increasing:
+        data = data.sort_values("Date", ignore_index=True)
     return resolved_symbol, data, candidates
 
 
+def _resolve_history_with_cache(
+    symbol: str, curr_date_dt: datetime
+) -> tuple[str, pd.DataFrame, tuple[str, ...]]:
+    """Fetch (or load cached) 15-year OHLCV history for `symbol`.
+
+    The resulting DataFrame is shared between :func:`get_yfin_data_online`
+    (which slices it by request window) and :func:`_get_stock_stats_bulk`
+    (which feeds it through stockstats), so a single download per ticker
+    services every market-analyst tool call.
+
+    The cache filename is ticker-only (`<TICKER>-YFin-data.parquet`, or
+    `.csv` when pyarrow is not installed); the
+    requested `[curr_date - 15y, curr_date + 1d]` window is verified at
+    read time so adjacent run dates reuse the same on-disk file. Without
+    this, daily backtests would produce a new cache file per business day
+    and never benefit from cache reuse.
+
+    Resolved frames are also memoised in-process per (symbol, date, cache
+    dir) for 24h when the date is historical and 60s otherwise; the
+    returned frame is shared and must not be mutated in place. Concurrent
+    callers for the same key share one in-flight fetch.
+
+    Args:
+        symbol: User-supplied ticker symbol.
+        curr_date_dt: The reference date used to build the 15-y window
+            and decide whether the cache is still fresh.
+
+    Returns:
+        `(resolved_symbol, dataframe, candidates)`; the candidates are a
+        tuple shared by every caller.
+
+    Raises:
+        ValueError: If no market data is found across all candidates.
+        RuntimeError: If every candidate raised on download.
+    """
+    cache_dir = get_cache_dir()
+    curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
+    key = (symbol, curr_date_str, cache_dir)
+    now = time.monotonic()
+    with _resolved_histories_lock:
+        cached = _resolved_histories.get(key)
+        if cached is not None and cached[0] > now:
+            _resolved_histories.move_to_end(key)
+            return cached[1]
+        pending = _pending_histories.get(key)
+        owner = pending is None
+        if pending is None:
+            pending = _pending_histories[key] = Future()
+
+    # Analyst tool calls run concurrently on the ToolNode's executor and
+    # typically all need the same ticker's history; the first caller
+    # fetches it while the others wait on its result instead of each
+    # re-reading (or re-downloading) the same 15 years.
+    if not owner:
+        return pending.result()
+    try:
+        resolved_symbol, data, candidates = _fetch_resolved_history(
+            symbol, curr_date_dt, cache_dir
+        )
+    except BaseException as exc:
+        with _resolved_histories_lock:
+            _pending_histories.pop(key, None)
+        pending.set_exception(exc)
+        raise
+
+    ttl = (
+        _HISTORICAL_HISTORY_TTL_SECONDS
+        if _is_historical_date(curr_date_str)
+        else _RECENT_HISTORY_TTL_SECONDS
+    )
+    # The candidate tuple is immutable, so every hit returns the stored
+    # result itself rather than a defensive copy of the candidate list.
+    result = (resolved_symbol, data, tuple(candidates))
+    with _resolved_histories_lock:
+        _resolved_histories[key] = (now + ttl, result)
+        _resolved_histories.move_to_end(key)
+        while len(_resolved_histories) > _MAX_RESOLVED_HISTORIES:
+            _resolved_histories.popitem(last=False)
+        _pending_histories.pop(key, None)
+    pending.set_result(result)
+    return result
+
+
 def _has_meaningful_ticker_info(info: dict) -> bool:
     """Return whether yfinance info contains an actual resolved quote.
 
@@ -387,12 +657,10 @@ def get_yfin_data_online(
     except (ValueError, RuntimeError) as exc:
         return f"[TOOL_ERROR] {exc}"
 
-    data = data.copy()
-    data["Date"] = pd.to_datetime(data["Date"])
-    if data["Date"].dt.tz is not None:
-        data["Date"] = data["Date"].dt.tz_localize(None)
-    mask = (data["Date"] >= pd.Timestamp(start_dt)) & (data["Date"] <= pd.Timestamp(end_dt))
-    sliced = data.loc[mask].copy()
+    dates = _history_dates(data)
+    lo = dates.searchsorted(pd.Timestamp(start_dt), side="left")
+    hi = dates.searchsorted(pd.Timestamp(end_dt), side="right")
+    sliced = data.iloc[lo:hi].copy()
 
     if sliced.empty:
         tried = describe_symbol_candidates(symbol, candidates)
@@ -406,13 +674,13 @@ def get_yfin_data_online(
         if col in sliced.columns:
             sliced[col] = sliced[col].round(2)
 
-    sliced["Date"] = sliced["Date"].dt.strftime("%Y-%m-%d")
+    sliced["Date"] = dates[lo:hi].strftime("%Y-%m-%d")
     csv_string = sliced.to_csv(index=False)
 
     header = f"# Stock data for {resolved_symbol} from {start_date} to {end_date}\n"
     header += f"# Total records: {len(sliced)}\n"
     header += "# Note: OHLC values are split- and dividend-adjusted (auto_adjust=True).\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
 
     return header + csv_string
 
@@ -548,19 +816,71 @@ BEST_IND_PARAMS: dict[str, str] = {
 }
 
 
+# Usage notes close every indicator section; the separator is joined once
+# here instead of on every formatted section.
+_INDICATOR_SECTION_TAILS: dict[str, str] = {
+    indicator: f"\n\n{description}" for indicator, description in BEST_IND_PARAMS.items()
+}
+
 _MIN_BARS_FOR_RELIABLE_INDICATORS = 50
 
+# stockstats adds every computed indicator (and its helper columns) to the
+# wrapped frame, so keeping the wrapper lets a later call for the same
+# history reuse them instead of re-wrapping and recomputing. Keys are the
+# resolved symbol and the truncation point. Each entry keeps its source
+# frame and is only reused for that exact object, so a refreshed history
+# (always a new frame) gets a new wrapper. Each entry carries its own lock
+# because computing a column mutates the wrapper.
+_MAX_WRAPPED_HISTORIES = 16
+# Every supported indicator derives from OHLCV; Yahoo's extra columns
+# (Dividends, Stock Splits, Adj Close) would only be copied and carried
+# along in every cached wrapper.
+_STOCKSTATS_COLUMNS = ("Date", "Open", "High", "Low", "Close", "Volume")
+_wrapped_histories: OrderedDict[
+    tuple[str, int], tuple[pd.DataFrame, StockDataFrame, threading.Lock]
+] = OrderedDict()
+_wrapped_histories_lock = threading.Lock()
+
+
+def _wrapped_history(
+    symbol: str, data: pd.DataFrame, end: int
+) -> tuple[StockDataFrame, threading.Lock]:
+    """Return the stockstats wrapper over `data[:end]` and the lock guarding it.
+
+    Only the OHLCV columns (plus `Date`) are handed to stockstats.
+    """
+    key = (symbol, end)
+    with _wrapped_histories_lock:
+        cached = _wrapped_histories.get(key)
+        if cached is not None and cached[0] is data:
+            _wrapped_histories.move_to_end(key)
+            return cached[1], cached[2]
+        columns = [column for column in _STOCKSTATS_COLUMNS if column in data.columns]
+        narrowed = data.iloc[:end, data.columns.get_indexer(columns)].reset_index(drop=True)
+        entry = (data, wrap(narrowed), threading.Lock())
+        _wrapped_histories[key] = entry
+        while len(_wrapped_histories) > _MAX_WRAPPED_HISTORIES:
+            _wrapped_histories.popitem(last=False)
+        return entry[1], entry[2]
+
 
 def _get_stock_stats_bulk_multi(
-    symbol: str, indicators: list[str], curr_date: str
+    symbol: str, indicators: list[str], curr_date: str, *, window_start: str | None = None
 ) -> tuple[str, dict[str, dict[str, str]], int]:
     """Resolve history once and compute every indicator in `indicators`.
 
+    Indicators are computed over the history up to `curr_date` (long windows
+    need the warm-up bars), but only rows inside `[window_start, curr_date]`
+    are converted to strings. Formatting every bar of a 15-y history per
+    indicator used to dominate the tool's runtime.
+
     Args:
         symbol: User-supplied ticker.
         indicators: List of stockstats indicator names; all assumed to be in
             :data:`BEST_IND_PARAMS`.
         curr_date: Current trading date in YYYY-MM-DD format.
+        window_start: Optional first date (YYYY-MM-DD) to format. When None,
+            every bar up to `curr_date` is returned.
 
     Returns:
         `(resolved_symbol, {indicator: {YYYY-MM-DD: value_str}}, n_bars)`.
@@ -575,17 +895,28 @@ def _get_stock_stats_bulk_multi(
     curr_date_dt = _parse_yyyy_mm_dd(curr_date, "curr_date")
     resolved_symbol, data, _ = _resolve_history_with_cache(symbol, curr_date_dt)
 
-    df = wrap(data.copy())
-    df["Date"] = pd.to_datetime(df["Date"])
-    if df["Date"].dt.tz is not None:
-        df["Date"] = df["Date"].dt.tz_localize(None)
-    df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+    dates = _history_dates(data)
+    # The ticker-only cache file can hold bars past `curr_date` (written by a
+    # later run); they are dropped before stockstats so no indicator is
+    # computed over bars that are never read or that leak the future.
+    end = dates.searchsorted(pd.Timestamp(curr_date_dt), side="right")
+    df, df_lock = _wrapped_history(resolved_symbol, data, int(end))
+
+    # The window is resolved to one positional slice shared by every
+    # indicator, instead of re-applying a full-length boolean mask per column.
+    start = 0
+    if window_start is not None:
+        start_dt = _parse_yyyy_mm_dd(window_start, "window_start")
+        start = min(dates.searchsorted(pd.Timestamp(start_dt), side="left"), end)
+    window_dates = dates[start:end].strftime("%Y-%m-%d").tolist()
 
     result: dict[str, dict[str, str]] = {}
     for ind in indicators:
-        df[ind]  # trigger stockstats to compute the column
-        formatted = df[ind].apply(lambda v: "N/A" if pd.isna(v) else str(v))
-        result[ind] = dict(zip(df["Date"], formatted, strict=False))
+        with df_lock:
+            values = df[ind].iloc[start:end]  # indexing triggers stockstats to compute the column
+        # Vectorised str() per value; matches the per-row formatting exactly.
+        formatted = values.astype(str).where(values.notna(), "N/A").tolist()
+        result[ind] = dict(zip(window_dates, formatted, strict=True))
     return resolved_symbol, result, len(df)
 
 
@@ -601,6 +932,28 @@ def _validate_indicators(indicators: list[str]) -> None:
         )
 
 
+def _format_indicator_section(
+    indicator: str, ind_data: dict[str, str], before_str: str, end_str: str
+) -> str:
+    """Render one indicator's values plus its usage notes as a report section.
+
+    `ind_data` comes from the chronological history, so the dates are
+    normally already in order; they are only sorted when a row is found
+    out of order.
+    """
+    sorted_dates = [d for d in ind_data if before_str <= d <= end_str]
+    if any(map(operator.gt, sorted_dates, sorted_dates[1:])):
+        sorted_dates.sort()
+    if sorted_dates:
+        ind_string = "".join(f"{d}: {ind_data[d]}\n" for d in sorted_dates)
+    else:
+        ind_string = "(no trading days in window)\n"
+    return (
+        f"## {indicator} values from {before_str} to {end_str} "
+        f"(chronological, trading days only):\n\n{ind_string}{_INDICATOR_SECTION_TAILS[indicator]}"
+    )
+
+
 def get_stock_stats_indicators_batch(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicators: Annotated[list[str], "list of technical indicators"],
@@ -615,8 +968,10 @@ def get_stock_stats_indicators_batch(
 
     Output is chronological (oldest -> newest) and only emits actual
     trading days, so weekend / holiday placeholder rows no longer waste
-    LLM context.
+    LLM context. Repeated indicator names are collapsed (first occurrence
+    wins) so an LLM that asks for `macd` twice gets one section.
     """
+    indicators = list(dict.fromkeys(indicators))
     _validate_indicators(indicators)
     if look_back_days < 0:
         raise ValueError("look_back_days must be >= 0.")
@@ -626,7 +981,12 @@ def get_stock_stats_indicators_batch(
     before_str = before.strftime("%Y-%m-%d")
     end_str = curr_date_dt.strftime("%Y-%m-%d")
 
-    _, data_map, n_bars = _get_stock_stats_bulk_multi(symbol, indicators, curr_date)
+    _, data_map, n_bars = _get_stock_stats_bulk_multi(
+        symbol, indicators, curr_date, window_start=before_str
+    )
+    sections = [
+        _format_indicator_section(ind, data_map[ind], before_str, end_str) for ind in indicators
+    ]
 
     preamble = ""
     if n_bars < _MIN_BARS_FOR_RELIABLE_INDICATORS:
@@ -639,20 +999,6 @@ def get_stock_stats_indicators_batch(
             f"shorter-window indicators (10 EMA, rsi) instead.\n\n"
         )
 
-    sections: list[str] = []
-    for ind in indicators:
-        ind_data = data_map[ind]
-        sorted_dates = sorted(d for d in ind_data if before_str <= d <= end_str)
-        if sorted_dates:
-            ind_string = "".join(f"{d}: {ind_data[d]}\n" for d in sorted_dates)
-        else:
-            ind_string = "(no trading days in window)\n"
-        sections.append(
-            f"## {ind} values from {before_str} to {end_str} (chronological, trading days only):\n\n"
-            + ind_string
-            + "\n\n"
-            + BEST_IND_PARAMS[ind]
-        )
     return preamble + "\n\n".join(sections)
 
 
@@ -775,15 +1121,13 @@ def _close_on_or_before(symbol: str, curr_date_dt: datetime) -> float | None:
     except Exception:
         logger.debug("Failed to resolve history for historical valuation", exc_info=True)
         return None
-    if data.empty or "Date" not in data.columns:
+    if data.empty or "Date" not in data.columns or "Close" not in data.columns:
         return None
-    dates = pd.to_datetime(data["Date"])
-    mask = dates <= pd.Timestamp(curr_date_dt)
-    eligible = data.loc[mask]
-    if eligible.empty or "Close" not in eligible.columns:
+    end = _history_dates(data).searchsorted(pd.Timestamp(curr_date_dt), side="right")
+    if end == 0:
         return None
     try:
-        return float(eligible["Close"].iloc[-1])
+        return float(data["Close"].iloc[end - 1])
     except (TypeError, ValueError):
         return None
 
@@ -833,6 +1177,52 @@ def _historical_valuation_block(
     return lines
 
 
+# `(label, yfinance.info key)` rows for :func:`get_fundamentals`. Historical
+# runs only show the static profile because every other `info` value is a
+# live snapshot that would leak post-`curr_date` data.
+_PROFILE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("Name", "longName"),
+    ("Sector", "sector"),
+    ("Industry", "industry"),
+)
+_SNAPSHOT_FIELDS: tuple[tuple[str, str], ...] = (
+    *_PROFILE_FIELDS,
+    ("Market Cap", "marketCap"),
+    ("PE Ratio (TTM)", "trailingPE"),
+    ("Forward PE", "forwardPE"),
+    ("PEG Ratio", "pegRatio"),
+    ("Price to Book", "priceToBook"),
+    ("EPS (TTM)", "trailingEps"),
+    ("Forward EPS", "forwardEps"),
+    ("Dividend Yield", "dividendYield"),
+    ("Beta", "beta"),
+    ("52 Week High", "fiftyTwoWeekHigh"),
+    ("52 Week Low", "fiftyTwoWeekLow"),
+    ("50 Day Average", "fiftyDayAverage"),
+    ("200 Day Average", "twoHundredDayAverage"),
+    ("Revenue (TTM)", "totalRevenue"),
+    ("Gross Profit", "grossProfits"),
+    ("EBITDA", "ebitda"),
+    ("Net Income", "netIncomeToCommon"),
+    ("Profit Margin", "profitMargins"),
+    ("Operating Margin", "operatingMargins"),
+    ("Return on Equity", "returnOnEquity"),
+    ("Return on Assets", "returnOnAssets"),
+    ("Debt to Equity", "debtToEquity"),
+    ("Current Ratio", "currentRatio"),
+    ("Book Value", "bookValue"),
+    ("Free Cash Flow", "freeCashflow"),
+)
+_BIG_NUMBER_FIELDS = frozenset({
+    "Market Cap",
+    "Revenue (TTM)",
+    "Gross Profit",
+    "EBITDA",
+    "Net Income",
+    "Free Cash Flow",
+})
+
+
 def get_fundamentals(
     ticker: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str | None, "current trading date in YYYY-MM-DD format"] = None,
@@ -866,57 +1256,14 @@ def get_fundamentals(
             f"{_NO_DATA_PREFIX} No fundamentals data found for symbol '{ticker}' (tried: {tried})"
         )
 
-    profile_fields = [
-        ("Name", info.get("longName")),
-        ("Sector", info.get("sector")),
-        ("Industry", info.get("industry")),
-    ]
-    big_number_fields = {
-        "Market Cap",
-        "Revenue (TTM)",
-        "Gross Profit",
-        "EBITDA",
-        "Net Income",
-        "Free Cash Flow",
-    }
-    snapshot_fields = [
-        ("Name", info.get("longName")),
-        ("Sector", info.get("sector")),
-        ("Industry", info.get("industry")),
-        ("Market Cap", info.get("marketCap")),
-        ("PE Ratio (TTM)", info.get("trailingPE")),
-        ("Forward PE", info.get("forwardPE")),
-        ("PEG Ratio", info.get("pegRatio")),
-        ("Price to Book", info.get("priceToBook")),
-        ("EPS (TTM)", info.get("trailingEps")),
-        ("Forward EPS", info.get("forwardEps")),
-        ("Dividend Yield", info.get("dividendYield")),
-        ("Beta", info.get("beta")),
-        ("52 Week High", info.get("fiftyTwoWeekHigh")),
-        ("52 Week Low", info.get("fiftyTwoWeekLow")),
-        ("50 Day Average", info.get("fiftyDayAverage")),
-        ("200 Day Average", info.get("twoHundredDayAverage")),
-        ("Revenue (TTM)", info.get("totalRevenue")),
-        ("Gross Profit", info.get("grossProfits")),
-        ("EBITDA", info.get("ebitda")),
-        ("Net Income", info.get("netIncomeToCommon")),
-        ("Profit Margin", info.get("profitMargins")),
-        ("Operating Margin", info.get("operatingMargins")),
-        ("Return on Equity", info.get("returnOnEquity")),
-        ("Return on Assets", info.get("returnOnAssets")),
-        ("Debt to Equity", info.get("debtToEquity")),
-        ("Current Ratio", info.get("currentRatio")),
-        ("Book Value", info.get("bookValue")),
-        ("Free Cash Flow", info.get("freeCashflow")),
-    ]
-
     is_historical = _is_historical_date(curr_date)
-    fields = profile_fields if is_historical else snapshot_fields
+    fields = _PROFILE_FIELDS if is_historical else _SNAPSHOT_FIELDS
     lines = []
-    for label, value in fields:
+    for label, key in fields:
+        value = info.get(key)
         if value is None:
             continue
-        if label in big_number_fields:
+        if label in _BIG_NUMBER_FIELDS:
             lines.append(f"{label}: {_humanize_number(value)}")
         else:
             lines.append(f"{label}: {value}")
@@ -938,7 +1285,7 @@ def get_fundamentals(
     if curr_date is not None:
         header += f"# Current trading date: {curr_date}\n"
     header += f"# Reporting currency (info.financialCurrency): {info.get('financialCurrency') or 'UNKNOWN'}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n"
     if is_historical:
         header += (
             "# Snapshot valuation/market metrics from yfinance.info are omitted "
@@ -1016,7 +1363,7 @@ def get_balance_sheet(
     header = f"# Balance Sheet data for {resolved_ticker} ({freq})\n"
     header += f"# Reported currency: {currency}\n"
     header += _statement_as_of_note(curr_date, freq)
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
 
     return header + csv_string
 
@@ -1081,7 +1428,7 @@ def get_cashflow(
     header = f"# Cash Flow data for {resolved_ticker} ({freq})\n"
     header += f"# Reported currency: {currency}\n"
     header += _statement_as_of_note(curr_date, freq)
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
 
     return header + csv_string
 
@@ -1146,7 +1493,7 @@ def get_income_statement(
     header = f"# Income Statement data for {resolved_ticker} ({freq})\n"
     header += f"# Reported currency: {currency}\n"
     header += _statement_as_of_note(curr_date, freq)
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
 
     return header + csv_string
 
@@ -1251,7 +1598,7 @@ def get_analyst_ratings(
     header = f"# Analyst Ratings (rolling counts) for {resolved_ticker}\n"
     if curr_date is not None:
         header += f"# Current trading date: {curr_date}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
 
     body = (
         recs.to_csv(index=False)
@@ -1290,7 +1637,7 @@ def get_earnings_calendar(  # noqa: C901, PLR0912, PLR0915 -- yfinance returns m
     pieces: list[str] = [f"# Earnings calendar for {resolved_ticker}"]
     if curr_date is not None:
         pieces.append(f"# Current trading date: {curr_date}")
-    pieces.append(f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    pieces.append(f"# Data retrieved on: {_retrieved_at()}")
 
     # Calendar snapshot. yfinance returns either a dict (newer releases) or a
     # pandas DataFrame (older releases); a bare `if cal:` check raises
@@ -1382,7 +1729,7 @@ def get_institutional_holders(
     pieces: list[str] = [f"# Institutional holders for {resolved_ticker} (current snapshot)"]
     if curr_date is not None:
         pieces.append(f"# Current trading date: {curr_date}")
-    pieces.append(f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    pieces.append(f"# Data retrieved on: {_retrieved_at()}")
 
     has_data = False
     try:
@@ -1445,7 +1792,7 @@ def get_short_interest(
     header = f"# Short interest for {resolved_ticker} (current snapshot)\n"
     if curr_date is not None:
         header += f"# Current trading date: {curr_date}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
     return header + "\n".join(f"{label}: {value}" for label, value in populated)
 
 
@@ -1466,7 +1813,7 @@ def get_dividends_splits(
 
     pieces: list[str] = [
         f"# Dividends and splits for {resolved_ticker} from {start_date} to {end_date}",
-        f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"# Data retrieved on: {_retrieved_at()}",
     ]
     found_any = False
 
@@ -1690,6 +2037,6 @@ def get_insider_transactions(
     header = f"# Insider Transactions data for {resolved_ticker}\n"
     if curr_date is not None:
         header += f"# Current trading date: {curr_date}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    header += f"# Data retrieved on: {_retrieved_at()}\n\n"
 
     return header + csv_string
@@ -1,10 +1,21 @@
 from typing import Literal
+from functools import cached_property
+from collections.abc import Callable
 
 from pydantic import Field, BaseModel
 
 from tradingagents.agents.utils.agent_states import AgentState
 
 
+def _has_tool_calls(state: AgentState) -> bool:
+    """Return whether the latest message requests tool calls.
+
+    Reads `tool_calls` once and tolerates non-AI messages (for example the
+    human message left in place when an analyst short-circuits).
+    """
+    return bool(getattr(state.messages[-1], "tool_calls", None))
+
+
 class ConditionalLogic(BaseModel):
     max_debate_rounds: int = Field(
         ...,
@@ -26,6 +37,24 @@ class ConditionalLogic(BaseModel):
         ),
     )
 
+    @cached_property
+    def analyst_routers(self) -> dict[str, Callable[[AgentState], str]]:
+        """Map each analyst type to its bound `should_continue_*` router.
+
+        Built once per instance, so graph setup resolves a router with a dict
+        lookup instead of a dynamic `getattr` per analyst, and a missing
+        router fails with a `KeyError` naming the analyst type.
+
+        Returns:
+            dict[str, Callable[[AgentState], str]]: Routers keyed by analyst type.
+        """
+        return {
+            "market": self.should_continue_market,
+            "social": self.should_continue_social,
+            "news": self.should_continue_news,
+            "fundamentals": self.should_continue_fundamentals,
+        }
+
     def should_continue_market(
         self, state: AgentState
     ) -> Literal["tools_market", "Msg Clear Market"]:
@@ -37,7 +66,7 @@ class ConditionalLogic(BaseModel):
         Returns:
             Literal["tools_market", "Msg Clear Market"]: Next node to execute.
         """
-        return "tools_market" if state.messages[-1].tool_calls else "Msg Clear Market"
+        return "tools_market" if _has_tool_calls(state) else "Msg Clear Market"
 
     def should_continue_social(
         self, state: AgentState
@@ -50,7 +79,7 @@ class ConditionalLogic(BaseModel):
         Returns:
             Literal["tools_social", "Msg Clear Social"]: Next node to execute.
         """
-        return "tools_social" if state.messages[-1].tool_calls else "Msg Clear Social"
+        return "tools_social" if _has_tool_calls(state) else "Msg Clear Social"
 
     def should_continue_news(self, state: AgentState) -> Literal["tools_news", "Msg Clear News"]:
         """Determine whether to continue news analysis or clear messages.
@@ -61,7 +90,7 @@ class ConditionalLogic(BaseModel):
         Returns:
             Literal["tools_news", "Msg Clear News"]: Next node to execute.
         """
-        return "tools_news" if state.messages[-1].tool_calls else "Msg Clear News"
+        return "tools_news" if _has_tool_calls(state) else "Msg Clear News"
 
     def should_continue_fundamentals(
         self, state: AgentState
@@ -74,7 +103,7 @@ class ConditionalLogic(BaseModel):
         Returns:
             Literal["tools_fundamentals", "Msg Clear Fundamentals"]: Next node to execute.
         """
-        return "tools_fundamentals" if state.messages[-1].tool_calls else "Msg Clear Fundamentals"
+        return "tools_fundamentals" if _has_tool_calls(state) else "Msg Clear Fundamentals"
 
     def should_continue_debate(
         self, state: AgentState
@@ -1,9 +1,11 @@
 from typing import Any
+from collections.abc import Callable
 
 from pydantic import Field, BaseModel, ConfigDict, SkipValidation
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.graph.state import CompiledStateGraph
+from langchain_core.runnables import RunnableConfig
 
 from tradingagents.llm import ChatModel
 from tradingagents.agents import (
@@ -30,6 +32,28 @@ from .conditional_logic import ConditionalLogic
 
 SUPPORTED_ANALYSTS = tuple(ANALYST_TOOL_REGISTRY)
 
+# analyst type -> (node factory, AgentState report field), so every
+# per-analyst property is resolved with a single lookup.
+_ANALYST_SPECS: dict[
+    str, tuple[Callable[[ChatModel], Callable[[AgentState], dict[str, Any]]], str]
+] = {
+    "market": (create_market_analyst, "market_report"),
+    "social": (create_social_media_analyst, "sentiment_report"),
+    "news": (create_news_analyst, "news_report"),
+    "fundamentals": (create_fundamentals_analyst, "fundamentals_report"),
+}
+
+# analyst type -> (analyst node, tool node, Msg Clear node) names, derived
+# once at import instead of re-formatted for every node and edge wired.
+_ANALYST_NODE_NAMES: dict[str, tuple[str, str, str]] = {
+    analyst_type: (
+        f"{analyst_type.capitalize()} Analyst",
+        f"tools_{analyst_type}",
+        f"Msg Clear {analyst_type.capitalize()}",
+    )
+    for analyst_type in SUPPORTED_ANALYSTS
+}
+
 
 class MemoryComponents(BaseModel):
     """Groups all memory components for the trading agents."""
@@ -89,6 +113,15 @@ class GraphSetup(BaseModel):
             "TradingAgentsConfig instead of silently defaulting."
         ),
     )
+    parallel_analysts: bool = Field(
+        default=False,
+        title="Parallel Analysts",
+        description=(
+            "Fan the selected analysts out from START so they run concurrently, "
+            "each inside its own analyst/tool subgraph, and join at the "
+            "Situation Summariser."
+        ),
+    )
 
     # --- Private helpers ---
 
@@ -116,6 +149,9 @@ class GraphSetup(BaseModel):
     ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
         """Create analyst, delete and tool nodes for selected analysts.
 
+        Msg Clear (delete) nodes are only created in sequential mode; the
+        parallel subgraphs keep their messages private and never clear them.
+
         Args:
             selected_analysts (list[str]): List of analyst types.
 
@@ -123,22 +159,16 @@ class GraphSetup(BaseModel):
             tuple[dict[str, Any], dict[str, Any], dict[str, Any]]: Analyst
                 nodes, message deletion nodes, and tool nodes keyed by analyst type.
         """
-        analyst_creators = {
-            "market": create_market_analyst,
-            "social": create_social_media_analyst,
-            "news": create_news_analyst,
-            "fundamentals": create_fundamentals_analyst,
-        }
         analyst_nodes: dict[str, Any] = {}
         delete_nodes: dict[str, Any] = {}
         tool_nodes: dict[str, Any] = {}
 
         for analyst_type in selected_analysts:
-            if analyst_type in analyst_creators:
-                analyst_nodes[analyst_type] = analyst_creators[analyst_type](
-                    self.quick_thinking_llm
-                )
-                delete_nodes[analyst_type] = create_msg_delete()
+            spec = _ANALYST_SPECS.get(analyst_type)
+            if spec is not None:
+                analyst_nodes[analyst_type] = spec[0](self.quick_thinking_llm)
+                if not self.parallel_analysts:
+                    delete_nodes[analyst_type] = create_msg_delete()
                 tool_nodes[analyst_type] = self.tool_nodes[analyst_type]
 
         return analyst_nodes, delete_nodes, tool_nodes
@@ -151,25 +181,94 @@ class GraphSetup(BaseModel):
             selected_analysts (list[str]): List of analyst types.
         """
         for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
+            current_analyst, current_tools, current_clear = _ANALYST_NODE_NAMES[analyst_type]
 
             workflow.add_conditional_edges(
                 current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                self.conditional_logic.analyst_routers[analyst_type],
                 [current_tools, current_clear],
             )
             workflow.add_edge(current_tools, current_analyst)
 
             if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i + 1].capitalize()} Analyst"
+                next_analyst = _ANALYST_NODE_NAMES[selected_analysts[i + 1]][0]
                 workflow.add_edge(current_clear, next_analyst)
             else:
                 # The Situation Summariser distils all four analyst reports
                 # into a compact BM25 query before any memory-backed node runs.
                 workflow.add_edge(current_clear, "Situation Summariser")
 
+    def _build_parallel_analyst_node(
+        self,
+        analyst_type: str,
+        analyst_node: Callable[[AgentState], dict[str, Any]],
+        tool_node: ToolNode,
+    ) -> Callable[[AgentState, RunnableConfig], dict[str, Any]]:
+        """Wrap one analyst's tool-calling loop as a self-contained node.
+
+        The analyst and its ToolNode run in a private subgraph so concurrent
+        analysts never interleave on the shared `messages` channel; only the
+        analyst's report field is written back to the parent state.
+
+        Args:
+            analyst_type (str): Analyst type, e.g. `"market"`.
+            analyst_node (Callable[[AgentState], dict[str, Any]]): Node created
+                by the analyst's factory.
+            tool_node (ToolNode): ToolNode serving the analyst's tools.
+
+        Returns:
+            Callable[[AgentState, RunnableConfig], dict[str, Any]]: A node
+                that runs the analyst loop to completion.
+        """
+        analyst_name, tools_name, clear_name = _ANALYST_NODE_NAMES[analyst_type]
+        report_field = _ANALYST_SPECS[analyst_type][1]
+
+        subgraph = StateGraph(AgentState)
+        subgraph.add_node(analyst_name, analyst_node)
+        subgraph.add_node(tools_name, tool_node)
+        subgraph.add_edge(START, analyst_name)
+        subgraph.add_conditional_edges(
+            analyst_name,
+            self.conditional_logic.analyst_routers[analyst_type],
+            {tools_name: tools_name, clear_name: END},
+        )
+        subgraph.add_edge(tools_name, analyst_name)
+        compiled = subgraph.compile()
+
+        def parallel_analyst_node(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+            final_state = compiled.invoke(state, config)
+            return {report_field: final_state[report_field]}
+
+        return parallel_analyst_node
+
+    def _add_parallel_analysts(
+        self,
+        workflow: StateGraph,
+        selected_analysts: list[str],
+        analyst_nodes: dict[str, Any],
+        tool_nodes: dict[str, Any],
+    ) -> None:
+        """Add analysts as concurrent branches that join at the Situation Summariser.
+
+        Args:
+            workflow (StateGraph): The LangGraph workflow to modify.
+            selected_analysts (list[str]): List of analyst types.
+            analyst_nodes (dict[str, Any]): Analyst nodes keyed by analyst type.
+            tool_nodes (dict[str, Any]): Tool nodes keyed by analyst type.
+        """
+        branch_names = []
+        for analyst_type in selected_analysts:
+            name = _ANALYST_NODE_NAMES[analyst_type][0]
+            workflow.add_node(
+                name,
+                self._build_parallel_analyst_node(
+                    analyst_type, analyst_nodes[analyst_type], tool_nodes[analyst_type]
+                ),
+            )
+            workflow.add_edge(START, name)
+            branch_names.append(name)
+        workflow.add_edge(branch_names, "Situation Summariser")
+
     # --- Public methods ---
 
     def setup_graph(self, selected_analysts: list[str] | None = None) -> CompiledStateGraph:
@@ -215,11 +314,13 @@ class GraphSetup(BaseModel):
         # Create workflow
         workflow = StateGraph(AgentState)
 
-        # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type])
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+        # Add analyst nodes to the graph (parallel analysts are added with their edges below)
+        if not self.parallel_analysts:
+            for analyst_type, node in analyst_nodes.items():
+                analyst_name, tools_name, clear_name = _ANALYST_NODE_NAMES[analyst_type]
+                workflow.add_node(analyst_name, node)
+                workflow.add_node(clear_name, delete_nodes[analyst_type])
+                workflow.add_node(tools_name, tool_nodes[analyst_type])
 
         # Add other nodes
         workflow.add_node("Situation Summariser", situation_summariser_node)
@@ -232,12 +333,15 @@ class GraphSetup(BaseModel):
         workflow.add_node("Conservative Analyst", conservative_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
 
-        # Define edges - start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+        if self.parallel_analysts:
+            # Fan analysts out from START; all branches join at the Summariser
+            self._add_parallel_analysts(workflow, selected_analysts, analyst_nodes, tool_nodes)
+        else:
+            # Define edges - start with the first analyst
+            workflow.add_edge(START, _ANALYST_NODE_NAMES[selected_analysts[0]][0])
 
-        # Connect analysts in sequence; the last analyst's Msg Clear feeds the Summariser
-        self._add_analyst_edges(workflow, selected_analysts)
+            # Connect analysts in sequence; the last analyst's Msg Clear feeds the Summariser
+            self._add_analyst_edges(workflow, selected_analysts)
         workflow.add_edge("Situation Summariser", "Bull Researcher")
 
         # Add research team edges
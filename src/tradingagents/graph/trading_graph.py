@@ -4,7 +4,7 @@ from typing import Any, Literal, overload
 import logging
 from pathlib import Path
 from functools import cached_property
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from pydantic import Field, BaseModel, ConfigDict, computed_field, model_validator
 from langgraph.prebuilt import ToolNode
@@ -26,6 +26,13 @@ from .signal_processing import SignalProcessor, TradeRecommendation
 
 logger = logging.getLogger(__name__)
 _SAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+_MEMORY_NAMES = (
+    "bull_memory",
+    "bear_memory",
+    "trader_memory",
+    "invest_judge_memory",
+    "risk_manager_memory",
+)
 
 # Bump when the on-disk shape of full_states_log_<TICKER>_<DATE>.json changes
 # in a way that requires migration on read. The reflect CLI reads logs
@@ -48,8 +55,19 @@ def _atomic_write_text(path: Path, content: str) -> None:
     a subsequent reflection step or downstream tool would silently
     parse as truncated JSON.
     """
+    _atomic_write_chunks(path, (content,))
+
+
+def _atomic_write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """Stream `chunks` into `path` atomically and as UTF-8.
+
+    Conversation logs run to megabytes of raw tool output; writing their
+    pieces through one open handle avoids first joining a second,
+    equally large copy of the document in memory.
+    """
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(content, encoding="utf-8")
+    with tmp.open("w", encoding="utf-8") as handle:
+        handle.writelines(chunks)
     tmp.replace(path)
 
 
@@ -152,9 +170,14 @@ class TradingAgentsGraph(BaseModel):
     def quick_thinking_llm(self) -> ChatModel:
         """Quick thinking LLM instance, derived from config.
 
+        When the quick and deep model names match, the deep instance is
+        reused so the graph holds one client instead of two identical ones.
+
         Returns:
             ChatModel: Quick thinking LLM instance.
         """
+        if self.config.quick_think_llm == self.config.deep_think_llm:
+            return self.deep_thinking_llm
         return self._create_llm(self.config.quick_think_llm)
 
     def _memory_path(self, name: str) -> Path:
@@ -232,6 +255,7 @@ class TradingAgentsGraph(BaseModel):
                 max_debate_rounds=self.config.max_debate_rounds,
                 max_risk_discuss_rounds=self.config.max_risk_discuss_rounds,
             ),
+            parallel_analysts=self.config.parallel_analysts,
         )
         return graph_setup.setup_graph(self.selected_analysts)
 
@@ -267,6 +291,25 @@ class TradingAgentsGraph(BaseModel):
 
     # --- Public methods ---
 
+    def fork(self) -> "TradingAgentsGraph":
+        """Return a copy with empty per-run state for another ticker.
+
+        Sharing contract: the copy reuses this instance's LLM clients and
+        tool nodes, which hold no per-run state and are built here if
+        needed. Everything that does hold state is not shared: the ticker,
+        current state and state logs start empty, and the memories and the
+        compiled workflow (whose nodes capture the memories) are rebuilt on
+        first use, reloading each memory from its JSONL file.
+
+        Returns:
+            TradingAgentsGraph: A new instance ready for another ticker.
+        """
+        _ = (self.deep_thinking_llm, self.quick_thinking_llm, self.tool_nodes)
+        forked = self.model_copy(update={"curr_state": None, "ticker": "", "log_states_dict": {}})
+        for name in (*_MEMORY_NAMES, "graph"):
+            forked.__dict__.pop(name, None)
+        return forked
+
     @overload
     def propagate(
         self,
@@ -350,12 +393,13 @@ class TradingAgentsGraph(BaseModel):
         raw_state = None
         last_emitted_id = None
         collected: dict[str, AnyMessage] = {}
+        # Bound once: the loop body runs for every stream chunk of the run.
+        dispatch_messages = self._dispatch_messages
+        dispatch_state = self._dispatch_state
         for chunk in self.graph.stream(init_agent_state, **args):
-            last_emitted_id = self._dispatch_messages(
-                chunk, collected, last_emitted_id, on_message
-            )
+            last_emitted_id = dispatch_messages(chunk, collected, last_emitted_id, on_message)
             if on_state is not None:
-                self._dispatch_state(chunk, on_state)
+                dispatch_state(chunk, on_state)
             raw_state = chunk
 
         if raw_state is None:
@@ -369,9 +413,12 @@ class TradingAgentsGraph(BaseModel):
         final_state = final_state.model_copy(update={"final_trade_recommendation": recommendation})
 
         self.curr_state = final_state
-        self._log_state(trade_date, final_state, list(collected.values()))
+        # One list serves both the conversation log and the caller; the
+        # stream loop itself only ever holds the latest snapshot.
+        all_messages = list(collected.values())
+        self._log_state(trade_date, final_state, all_messages)
         if return_messages:
-            return final_state, recommendation, list(collected.values())
+            return final_state, recommendation, all_messages
         return final_state, recommendation
 
     def _dispatch_messages(
@@ -385,7 +432,10 @@ class TradingAgentsGraph(BaseModel):
 
         Mutates `collected` so the eventual `_log_state` call sees
         every message that ever flew past, even those wiped by Msg
-        Clear nodes between analyst phases.
+        Clear nodes between analyst phases. Between clears the message
+        list only grows, so it is scanned from the tail back to the
+        first already-collected ID instead of re-checking the whole
+        history on every chunk.
 
         Args:
             chunk (Any): One snapshot from `graph.stream` -- either a
@@ -406,10 +456,15 @@ class TradingAgentsGraph(BaseModel):
         )
         if not messages:
             return last_emitted_id
-        for msg in messages:
+        fresh: list[AnyMessage] = []
+        for msg in reversed(messages):
             mid = getattr(msg, "id", None)
-            if mid and mid not in collected:
-                collected[mid] = msg
+            if mid in collected:
+                break
+            if mid:
+                fresh.append(msg)
+        for msg in reversed(fresh):
+            collected[msg.id] = msg
         latest = messages[-1]
         if latest.id == last_emitted_id:
             return last_emitted_id
@@ -527,8 +582,7 @@ class TradingAgentsGraph(BaseModel):
         # Human-readable text log (same format as debug pretty_print output)
         txt_path = directory / f"conversation_log_{ticker_name}_{trade_date}.txt"
         try:
-            txt_content = "".join(msg.pretty_repr() + "\n" for msg in filtered)
-            _atomic_write_text(txt_path, txt_content)
+            _atomic_write_chunks(txt_path, (msg.pretty_repr() + "\n" for msg in filtered))
             logger.info("Conversation log saved to %s", txt_path)
         except Exception:
             logger.warning("Failed to save conversation text log", exc_info=True)
@@ -536,9 +590,8 @@ class TradingAgentsGraph(BaseModel):
         # Structured JSON log (machine-readable, for programmatic analysis)
         json_path = directory / f"conversation_log_{ticker_name}_{trade_date}.json"
         try:
-            _atomic_write_text(
-                json_path, json.dumps(messages_to_dict(filtered), indent=2, ensure_ascii=False)
-            )
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+            _atomic_write_chunks(json_path, encoder.iterencode(messages_to_dict(filtered)))
             logger.info("Conversation JSON saved to %s", json_path)
         except Exception:
             logger.warning("Failed to save conversation JSON log", exc_info=True)
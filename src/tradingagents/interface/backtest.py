@@ -19,7 +19,8 @@ if TYPE_CHECKING:
 def _split_tickers(value: str | list[str] | tuple[str, ...]) -> list[str]:
     """Split a fire-friendly `--tickers` argument into a clean list."""
     items = list(value) if isinstance(value, (list, tuple)) else str(value).split(",")
-    cleaned = [str(item).strip() for item in items if str(item).strip()]
+    stripped = (str(item).strip() for item in items)
+    cleaned = [item for item in stripped if item]
     if not cleaned:
         raise ValueError("--tickers must contain at least one symbol.")
     return cleaned
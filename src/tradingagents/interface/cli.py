@@ -8,7 +8,12 @@ from rich.console import Console
 from tradingagents.llm import LLMProvider, ReasoningEffort  # noqa: TC001
 from tradingagents.config import ResponseLanguage, TradingAgentsConfig
 from tradingagents.graph.setup import SUPPORTED_ANALYSTS, GraphSetup
-from tradingagents.interface.display import MessageRenderer, print_run_header, print_final_decision
+from tradingagents.interface.display import (
+    MessageRenderer,
+    BackgroundEmitter,
+    print_run_header,
+    print_final_decision,
+)
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 
 if TYPE_CHECKING:
@@ -112,10 +117,15 @@ def run_cli(  # noqa: PLR0913
     console = Console()
     print_run_header(console, ticker=ticker, trade_date=date, config=config)
 
-    renderer = MessageRenderer.for_console(console=console)
-
     ta = TradingAgentsGraph(debug=debug, config=config, selected_analysts=analysts)
-    _, recommendation = ta.propagate(company_name=ticker, trade_date=date, on_message=renderer)
+    # Panels are printed on a render thread so terminal output never holds
+    # up the next graph step; a backlog of panels is written in one buffered
+    # flush, and leaving the block flushes anything still queued. A panel
+    # that fails to render is logged, not raised, so a finished run still
+    # prints and returns its decision.
+    with BackgroundEmitter.for_console(console) as emit:
+        renderer = MessageRenderer(emit=emit)
+        _, recommendation = ta.propagate(company_name=ticker, trade_date=date, on_message=renderer)
 
     print_final_decision(console, recommendation)
     return recommendation
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+import queue
+from typing import TYPE_CHECKING, Any, Self, cast
+import logging
+import functools
+import threading
+from contextlib import suppress, nullcontext
 from collections.abc import Callable  # noqa: TC003  # runtime-required by Pydantic field type
 
-from pydantic import Field, BaseModel, ConfigDict
+from pydantic import Field, BaseModel, ConfigDict, PrivateAttr
 from rich.json import JSON
 from rich.text import Text
 from rich.panel import Panel
@@ -14,13 +19,36 @@ from rich.markdown import Markdown
 from langchain_core.messages import AIMessage, ToolMessage, HumanMessage, SystemMessage
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from langchain_core.messages import AnyMessage
 
     from tradingagents.config import TradingAgentsConfig
     from tradingagents.graph.signal_processing import TradeRecommendation
 
 
+logger = logging.getLogger(__name__)
+
 _MAX_TOOL_LINES = 40
+_STOP = object()
+
+
+# Message class -> MessageRenderer method; checked in order for subclasses.
+_RENDER_METHOD_NAMES: dict[type, str] = {
+    HumanMessage: "_render_human",
+    AIMessage: "_render_ai",
+    ToolMessage: "_render_tool",
+    SystemMessage: "_render_system",
+}
+
+
+@functools.cache
+def _render_method_name(message_type: type) -> str:
+    """Return the render method name for `message_type`, honouring subclasses."""
+    for base, name in _RENDER_METHOD_NAMES.items():
+        if issubclass(message_type, base):
+            return name
+    return "_render_unknown"
 
 
 class MessageRenderer(BaseModel):
@@ -75,22 +103,15 @@ class MessageRenderer(BaseModel):
     def render(self, message: AnyMessage) -> None:
         """Render a single LangChain message.
 
+        The handler is looked up by the message's exact type, so the
+        per-message cost is one dict hit instead of an `isinstance` chain;
+        subclasses (e.g. `AIMessageChunk`) are resolved once and cached.
+
         Args:
             message (AnyMessage): The LangChain message to render. Unknown
                 message types fall through to a generic panel.
         """
-        if isinstance(message, HumanMessage):
-            if isinstance(message.content, str) and message.content.strip() == "Continue":
-                return
-            self._render_human(message)
-        elif isinstance(message, AIMessage):
-            self._render_ai(message)
-        elif isinstance(message, ToolMessage):
-            self._render_tool(message)
-        elif isinstance(message, SystemMessage):
-            self._render_system(message)
-        else:
-            self._render_unknown(message)
+        getattr(self, _render_method_name(type(message)))(message)
 
     def _render_ai(self, message: AIMessage) -> None:
         """Render an AIMessage (assistant turn).
@@ -141,8 +162,11 @@ class MessageRenderer(BaseModel):
         """Render a HumanMessage (user turn).
 
         Args:
-            message (HumanMessage): The human-authored message.
+            message (HumanMessage): The human-authored message. The
+                "Continue" placeholder is skipped.
         """
+        if isinstance(message.content, str) and message.content.strip() == "Continue":
+            return
         body = self._content_to_renderable(message.content) or Text("(no content)", style="dim")
         self.emit(
             Panel(body, title="[bold green]Human[/]", title_align="left", border_style="green")
@@ -204,7 +228,9 @@ class MessageRenderer(BaseModel):
             RenderableType | None: A Rich renderable (typically a Markdown
             block for prose), or None when the content is empty.
         """
-        if content is None:
+        # Tool-calling AI turns usually carry `""` (or `[]`) content; bail
+        # out before any stripping or joining.
+        if not content:
             return None
         if isinstance(content, str):
             text = content.strip()
@@ -249,12 +275,155 @@ class MessageRenderer(BaseModel):
             except (ValueError, json.JSONDecodeError):
                 pass
 
-        lines = stripped.splitlines()
-        if len(lines) > _MAX_TOOL_LINES:
-            head = "\n".join(lines[:_MAX_TOOL_LINES])
-            footer = f"\n... [{len(lines) - _MAX_TOOL_LINES} more lines truncated]"
-            return Text(head + footer)
-        return Text(stripped)
+        # Tool payloads (price windows, news dumps) can be far longer than
+        # the panel shows, so locate the cut point by scanning for newlines
+        # instead of splitting the whole payload into a list of lines.
+        cut = -1
+        for _ in range(_MAX_TOOL_LINES):
+            cut = stripped.find("\n", cut + 1)
+            if cut == -1:
+                return Text(stripped)
+        remaining = stripped.count("\n", cut)
+        return Text(f"{stripped[:cut]}\n... [{remaining} more lines truncated]")
+
+
+class BackgroundEmitter(BaseModel):
+    """Forward renderables to `target` from a dedicated render thread.
+
+    `TradingAgentsGraph.propagate` only advances the graph when the
+    `on_message` callback returns, so printing Rich panels (Markdown
+    parsing, wrapping, terminal writes) inline stalls the next node.
+    Wrapping the sink in this emitter turns each callback into a queue
+    put; a daemon thread drains the queue in order. Use it as a context
+    manager (or call :meth:`close`) so every queued panel is flushed
+    before the caller prints anything else. A renderable that fails to
+    print is logged with its traceback and skipped; the first such error
+    is re-raised by :meth:`close` once the queue is drained.
+
+    Panels that pile up while the terminal is busy are drained as one
+    batch; when a `console` is attached the batch is rendered inside its
+    buffer, so the terminal is written and flushed once per batch rather
+    than once per panel.
+
+    Attributes:
+        target (Callable[[RenderableType], None]): The real sink, e.g.
+            `Console.print`. Only ever called from the render thread.
+        console (Console | None): Console whose output buffer wraps each
+            drained batch. None emits every renderable unbuffered.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    target: Callable[[RenderableType], None] = Field(
+        ...,
+        title="Target",
+        description="Sink invoked on the render thread for each queued renderable.",
+    )
+    console: Console | None = Field(
+        default=None,
+        title="Console",
+        description="Console whose output buffer wraps each drained batch of renderables.",
+    )
+
+    _queue: queue.SimpleQueue[object] = PrivateAttr(default_factory=queue.SimpleQueue)
+    _thread: threading.Thread | None = PrivateAttr(default=None)
+    _error: Exception | None = PrivateAttr(default=None)
+
+    @classmethod
+    def for_console(cls, console: Console) -> BackgroundEmitter:
+        """Build an emitter that prints batched panels on `console`.
+
+        Args:
+            console (Console): The Rich console to print on.
+
+        Returns:
+            BackgroundEmitter: An emitter targeting `console.print` with
+            batch buffering enabled.
+        """
+        return cls(target=console.print, console=console)
+
+    def __call__(self, renderable: RenderableType) -> None:
+        """Queue `renderable` for the render thread, starting it on first use.
+
+        Args:
+            renderable (RenderableType): The Rich renderable to emit.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._drain, name="tradingagents-render", daemon=True
+            )
+            self._thread.start()
+        self._queue.put(renderable)
+
+    def close(self) -> None:
+        """Block until every queued renderable has been emitted.
+
+        Raises:
+            Exception: The first error raised while emitting a renderable.
+        """
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> Self:
+        """Return the emitter itself for use as an `emit` callback."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush outstanding renderables, including when the run raised.
+
+        Render errors are not re-raised here: the render thread has already
+        logged each one with its traceback, and a broken panel must neither
+        discard a run that completed nor mask the exception that ended it.
+        Call :meth:`close` directly to have the first render error raised.
+        """
+        with suppress(Exception):
+            self.close()
+
+    def _drain(self) -> None:
+        """Emit queued renderables in order until the stop sentinel arrives."""
+        while True:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            stop = batch[-1] is _STOP
+            try:
+                with self.console if self.console is not None else nullcontext():
+                    for item in batch[:-1] if stop else batch:
+                        self._emit_one(item)
+            except Exception as error:
+                # Only the buffered write itself can land here; keep draining
+                # so later batches still reach the terminal.
+                self._record_error(error)
+            if stop:
+                return
+
+    def _emit_one(self, item: object) -> None:
+        """Emit one renderable, recording a failure instead of aborting the batch.
+
+        Rich renders each `print` into segments before appending them to the
+        console buffer, so a renderable that raises leaves nothing behind and
+        the rest of the batch still lands in the shared flush.
+        """
+        try:
+            self.target(cast("RenderableType", item))
+        except Exception as error:
+            self._record_error(error)
+
+    def _record_error(self, error: Exception) -> None:
+        """Log `error` with its traceback and keep the first one for :meth:`close`."""
+        logger.warning("Background emit failed", exc_info=error)
+        if self._error is None:
+            self._error = error
 
 
 def make_run_header_panel(*, ticker: str, trade_date: str, config: TradingAgentsConfig) -> Panel:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
+import functools
 
 from pydantic import Field, BaseModel
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from tradingagents.agents.utils.agent_states import AgentState
 
 PhaseStatus = Literal["pending", "running", "done"]
@@ -51,10 +54,80 @@ class Phase(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _analyst_layout(selected_analysts: tuple[str, ...]) -> tuple[tuple[str, str, str | None], ...]:
+    """Return `(phase id, label, report field)` for each selected analyst.
+
+    The analyst rows are fixed once the run's analysts are chosen, so the
+    ids, label fallbacks and report-field lookups are resolved once per
+    selection rather than on every sidebar refresh.
+    """
+    return tuple(
+        (
+            f"phase-{analyst}",
+            ANALYST_PHASE_LABELS.get(analyst, analyst.title()),
+            ANALYST_REPORT_FIELDS.get(analyst),
+        )
+        for analyst in selected_analysts
+    )
+
+
+def _filled(value: str | None) -> bool:
+    """Return True when a report field holds non-whitespace text.
+
+    Reports run to several kilobytes and are checked on every state
+    snapshot; `str.isspace` answers without copying the text the way
+    `strip()` does.
+    """
+    return bool(value) and not value.isspace()
+
+
+# Text fields whose completion moves a phase to "done", one bit each in
+# :func:`phase_signature`; the research judge's decision takes the next bit.
+_COMPLETION_FIELDS: tuple[str, ...] = (
+    *ANALYST_REPORT_FIELDS.values(),
+    "situation_summary",
+    "investment_plan",
+    "trader_investment_plan",
+    "final_trade_decision",
+)
+_JUDGE_DECISION_BIT = 1 << len(_COMPLETION_FIELDS)
+
+
+def phase_signature(state: AgentState) -> tuple[int, int, int]:
+    """Summarise exactly the `AgentState` fields :func:`derive_phases` reads.
+
+    Most stream chunks (tool calls, tool results, intermediate debate
+    messages) leave every phase untouched. Comparing this small tuple
+    against the previous one lets callers skip rebuilding the phase list
+    when nothing the sidebar shows has changed.
+
+    Args:
+        state (AgentState): A streamed AgentState snapshot.
+
+    Returns:
+        tuple[int, int, int]: A bitmask of completed report fields (see
+        `_COMPLETION_FIELDS`), then the research and risk debate counters.
+    """
+    completed = 0
+    for bit, field in enumerate(_COMPLETION_FIELDS):
+        if _filled(getattr(state, field, "")):
+            completed |= 1 << bit
+    invest = state.investment_debate_state
+    risk = state.risk_debate_state
+    if invest is not None and _filled(invest.judge_decision):
+        completed |= _JUDGE_DECISION_BIT
+    return (
+        completed,
+        invest.count if invest is not None else 0,
+        risk.count if risk is not None else 0,
+    )
+
+
 def derive_phases(
     state: AgentState | None,
     *,
-    selected_analysts: list[str],
+    selected_analysts: Sequence[str],
     max_debate_rounds: int,
     max_risk_discuss_rounds: int,
 ) -> list[Phase]:
@@ -79,9 +152,10 @@ def derive_phases(
     Args:
         state (AgentState | None): The latest streamed AgentState, or
             None before the first chunk arrives.
-        selected_analysts (list[str]): Subset of {"market", "social",
-            "news", "fundamentals"} to include as separate analyst
-            phases.
+        selected_analysts (Sequence[str]): Subset of {"market",
+            "social", "news", "fundamentals"} to include as separate
+            analyst phases. Pass a tuple on hot paths; it is used as the
+            layout cache key without being copied.
         max_debate_rounds (int): Maximum Bull/Bear debate rounds, used
             for the "N/M" progress display.
         max_risk_discuss_rounds (int): Maximum risk-debate rounds.
@@ -91,16 +165,11 @@ def derive_phases(
     """
     phases: list[Phase] = []
 
-    for analyst in selected_analysts:
-        field = ANALYST_REPORT_FIELDS.get(analyst)
-        label = ANALYST_PHASE_LABELS.get(analyst, analyst.title())
-        phases.append(Phase(id=f"phase-{analyst}", label=label, progress=""))
-        if state is not None and field is not None:
-            value = getattr(state, field, "") or ""
-            if value.strip():
-                phases[-1] = phases[-1].model_copy(update={"status": "done"})
+    for phase_id, label, field in _analyst_layout(tuple(selected_analysts)):
+        done = state is not None and field is not None and _filled(getattr(state, field, ""))
+        phases.append(Phase(id=phase_id, label=label, status="done" if done else "pending"))
 
-    summariser_done = bool(state is not None and (state.situation_summary or "").strip())
+    summariser_done = state is not None and _filled(state.situation_summary)
     phases.append(
         Phase(
             id="phase-situation-summary",
@@ -111,7 +180,7 @@ def derive_phases(
 
     invest = state.investment_debate_state if state is not None else None
     invest_count = invest.count if invest is not None else 0
-    invest_done = bool(invest is not None and (invest.judge_decision or "").strip())
+    invest_done = invest is not None and _filled(invest.judge_decision)
     phases.append(
         Phase(
             id="phase-research-debate",
@@ -121,7 +190,7 @@ def derive_phases(
         )
     )
 
-    research_done = bool(state is not None and (state.investment_plan or "").strip())
+    research_done = state is not None and _filled(state.investment_plan)
     phases.append(
         Phase(
             id="phase-research-manager",
@@ -130,14 +199,14 @@ def derive_phases(
         )
     )
 
-    trader_done = bool(state is not None and (state.trader_investment_plan or "").strip())
+    trader_done = state is not None and _filled(state.trader_investment_plan)
     phases.append(
         Phase(id="phase-trader", label="Trader", status="done" if trader_done else "pending")
     )
 
     risk = state.risk_debate_state if state is not None else None
     risk_count = risk.count if risk is not None else 0
-    final_done = bool(state is not None and (state.final_trade_decision or "").strip())
+    final_done = state is not None and _filled(state.final_trade_decision)
     phases.append(
         Phase(
             id="phase-risk-debate",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, ClassVar
 import logging
+import threading
 
 from textual import work
 from rich.text import Text
@@ -18,7 +19,7 @@ from tradingagents.interface.display import (
     make_final_decision_panel,
 )
 from tradingagents.graph.trading_graph import TradingAgentsGraph
-from tradingagents.interface.tui.phase_tracker import Phase, derive_phases
+from tradingagents.interface.tui.phase_tracker import Phase, derive_phases, phase_signature
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
@@ -31,6 +32,17 @@ logger = logging.getLogger(__name__)
 
 _PHASE_ICONS: dict[str, str] = {"pending": "o", "running": ">", "done": "v"}
 
+# The graph streams one state snapshot per node, often in bursts (tool
+# round-trips, debate turns). The sidebar only needs the latest one, so
+# snapshots are coalesced and applied at most this often.
+_PHASE_REFRESH_INTERVAL = 0.15
+
+# A full run (ten-round debates, tool dumps) renders tens of thousands of
+# log lines. RichLog keeps every rendered line strip in memory for the
+# lifetime of the screen, so scrollback is capped; the complete transcript is
+# still written to conversation_log_<TICKER>_<DATE>.txt after the run.
+_MAX_LOG_LINES = 5000
+
 
 class PhaseRow(Static):
     """One row in the phase sidebar.
@@ -50,30 +62,43 @@ class PhaseRow(Static):
         """
         super().__init__(id=phase.id, classes=f"phase-row -{phase.status}")
         self._phase = phase
+        self._rendered: Text | None = None
 
     def render(self) -> Text:
         """Compose the row content as a Rich Text line.
 
+        Textual calls this on every repaint (scrolling, resizes, sibling
+        refreshes), so the parsed markup is kept until
+        :meth:`update_phase` changes the row.
+
         Returns:
             Text: An icon, the phase label, and an optional progress
             counter, separated by a space.
         """
-        icon = _PHASE_ICONS.get(self._phase.status, "?")
-        suffix = f"  {self._phase.progress}" if self._phase.progress else ""
-        return Text.from_markup(f"{icon}  {self._phase.label}{suffix}")
+        if self._rendered is None:
+            icon = _PHASE_ICONS.get(self._phase.status, "?")
+            suffix = f"  {self._phase.progress}" if self._phase.progress else ""
+            self._rendered = Text.from_markup(f"{icon}  {self._phase.label}{suffix}")
+        return self._rendered
 
     def update_phase(self, phase: Phase) -> None:
         """Replace the row's contents and CSS class with `phase`.
 
+        Debate rows change their progress counter far more often than
+        their status, so the status CSS class (which makes Textual restyle
+        the widget) is only swapped when the status itself changes.
+
         Args:
             phase (Phase): The new phase data; only fields whose values
                 differ from the previous render trigger a refresh.
         """
         if phase == self._phase:
             return
+        if phase.status != self._phase.status:
+            self.remove_class(f"-{self._phase.status}")
+            self.add_class(f"-{phase.status}")
         self._phase = phase
-        self.remove_class("-pending", "-running", "-done")
-        self.add_class(f"-{phase.status}")
+        self._rendered = None
         self.refresh()
 
 
@@ -100,9 +125,16 @@ class RunScreen(Screen[None]):
         """
         super().__init__()
         self.params = params
+        # Fixed for the whole run; a tuple doubles as the phase-layout cache
+        # key, so each refresh skips re-copying the selection list.
+        self._selected_analysts = tuple(params.selected_analysts)
         self._log: RichLog | None = None
         self._status: Static | None = None
+        self._phase_rows: dict[str, PhaseRow] = {}
+        self._last_phase_signature: tuple[int, int, int] | None = None
         self._final_decision: TradeRecommendation | None = None
+        self._pending_state: AgentState | None = None
+        self._pending_state_lock = threading.Lock()
         self._config = TradingAgentsConfig(
             llm_provider=params.llm_provider,
             deep_think_llm=params.deep_think_llm,
@@ -134,14 +166,21 @@ class RunScreen(Screen[None]):
                 for phase in self._initial_phases():
                     yield PhaseRow(phase)
             yield RichLog(
-                id="messages", wrap=True, markup=False, highlight=False, auto_scroll=True
+                id="messages",
+                max_lines=_MAX_LOG_LINES,
+                wrap=True,
+                markup=False,
+                highlight=False,
+                auto_scroll=True,
             )
         yield Static("Initialising...", id="run-status")
 
     def on_mount(self) -> None:
-        """Cache widget references and kick off the pipeline worker."""
+        """Cache widget references (including every phase row by id) and start the worker."""
         self._log = self.query_one("#messages", RichLog)
         self._status = self.query_one("#run-status", Static)
+        self._phase_rows = {row.id: row for row in self.query(PhaseRow) if row.id is not None}
+        self.set_interval(_PHASE_REFRESH_INTERVAL, self._flush_pending_state)
         self.run_pipeline()
 
     def action_quit_screen(self) -> None:
@@ -154,8 +193,9 @@ class RunScreen(Screen[None]):
 
         Constructs a :class:`MessageRenderer` whose `emit` defers each
         Rich renderable to the Textual event loop, and an `on_state`
-        hook that recomputes the sidebar phase list from the latest
-        :class:`AgentState` snapshot. All UI mutations are routed
+        hook that stashes the latest :class:`AgentState` snapshot for
+        the sidebar refresh timer (see :meth:`_flush_pending_state`).
+        All other UI mutations are routed
         through :meth:`App.call_from_thread` via :meth:`_safe_call` so
         the worker unwinds quietly when the user quits mid-run; a
         broken hook can never abort a paid LLM call once it has
@@ -171,7 +211,8 @@ class RunScreen(Screen[None]):
         renderer = MessageRenderer(emit=emit)
 
         def on_state(state: AgentState) -> None:
-            self._safe_call(self._update_phases_from_state, state)
+            with self._pending_state_lock:
+                self._pending_state = state
 
         self._safe_call(self._set_status, "Running pipeline...")
 
@@ -231,28 +272,47 @@ class RunScreen(Screen[None]):
         """
         return derive_phases(
             None,
-            selected_analysts=self.params.selected_analysts,
+            selected_analysts=self._selected_analysts,
             max_debate_rounds=self.params.max_debate_rounds,
             max_risk_discuss_rounds=self.params.max_risk_discuss_rounds,
         )
 
+    def _flush_pending_state(self) -> None:
+        """Apply the newest stashed snapshot to the sidebar, if any arrived.
+
+        Runs on the Textual event loop every `_PHASE_REFRESH_INTERVAL`
+        seconds, so a burst of stream chunks between ticks costs a
+        single :func:`derive_phases` pass and one round of row updates
+        instead of one per chunk.
+        """
+        with self._pending_state_lock:
+            state, self._pending_state = self._pending_state, None
+        if state is not None:
+            self._update_phases_from_state(state)
+
     def _update_phases_from_state(self, state: AgentState) -> None:
         """Refresh every :class:`PhaseRow` from the latest `AgentState`.
 
+        Snapshots whose :func:`phase_signature` matches the previously
+        applied one cannot change any row and are skipped.
+
         Args:
             state (AgentState): The most recent streamed snapshot.
         """
+        signature = phase_signature(state)
+        if signature == self._last_phase_signature:
+            return
+        self._last_phase_signature = signature
         phases = derive_phases(
             state,
-            selected_analysts=self.params.selected_analysts,
+            selected_analysts=self._selected_analysts,
             max_debate_rounds=self.params.max_debate_rounds,
             max_risk_discuss_rounds=self.params.max_risk_discuss_rounds,
         )
         for phase in phases:
-            try:
-                row = self.query_one(f"#{phase.id}", PhaseRow)
-            except Exception:
-                logger.debug("Phase row %s not found", phase.id, exc_info=True)
+            row = self._phase_rows.get(phase.id)
+            if row is None:
+                logger.debug("Phase row %s not found", phase.id)
                 continue
             row.update_phase(phase)
 
@@ -274,6 +334,7 @@ class RunScreen(Screen[None]):
                 :meth:`TradingAgentsGraph.process_signal`.
         """
         self._final_decision = recommendation
+        self._flush_pending_state()
         if self._log is not None:
             self._log.write(make_final_decision_panel(recommendation))
         self._set_status(
@@ -288,6 +349,7 @@ class RunScreen(Screen[None]):
         Args:
             exc (BaseException): The exception raised by the worker.
         """
+        self._flush_pending_state()
         if self._log is not None:
             self._log.write(
                 Panel(
@@ -0,0 +1,52 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph.message import add_messages
+
+from tradingagents.agents.utils import agent_utils
+from tradingagents.agents.utils.agent_utils import create_msg_delete
+from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.core_stock_tools import get_stock_data
+
+
+def test_msg_delete_replaces_history_with_placeholder() -> None:
+    history = [
+        HumanMessage(content="AAPL", id="h1"),
+        AIMessage(content="calling tools", id="a1"),
+        AIMessage(content="report", id="a2"),
+    ]
+    state = AgentState(messages=history, company_of_interest="AAPL", trade_date="2024-05-10")
+
+    update = create_msg_delete()(state)
+    merged = add_messages(history, update["messages"])
+
+    assert len(update["messages"]) == 2
+    assert len(merged) == 1
+    assert isinstance(merged[0], HumanMessage)
+    assert merged[0].content == "Continue"
+
+
+def test_msg_delete_on_empty_history_only_adds_placeholder() -> None:
+    state = AgentState(messages=[], company_of_interest="AAPL", trade_date="2024-05-10")
+
+    update = create_msg_delete()(state)
+
+    assert [m.content for m in update["messages"]] == ["Continue"]
+
+
+def test_msg_delete_placeholder_survives_repeated_clears() -> None:
+    delete = create_msg_delete()
+    history: list = [HumanMessage(content="AAPL", id="h1")]
+
+    for round_id in range(3):
+        history = add_messages(history, [AIMessage(content="report", id=f"a{round_id}")])
+        state = AgentState(messages=history, company_of_interest="AAPL", trade_date="2024-05-10")
+        history = add_messages(history, delete(state)["messages"])
+
+        assert [m.content for m in history] == ["Continue"]
+
+
+def test_agent_utils_lazy_exports_resolve_to_tool_objects() -> None:
+    assert agent_utils.get_stock_data is get_stock_data
+    assert set(agent_utils.__all__) <= set(dir(agent_utils))
+    with pytest.raises(AttributeError):
+        _ = agent_utils.not_a_tool
@@ -0,0 +1,246 @@
+from typing import Any
+from pathlib import Path
+from contextvars import ContextVar
+
+import pytest
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, ToolMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.prompt_values import ChatPromptValue
+
+from tradingagents import config as config_module
+from tradingagents.config import TradingAgentsConfig
+from tradingagents.agents.analysts._helpers import (
+    make_analyst_node,
+    _has_final_proposal,
+    _static_system_message,
+)
+from tradingagents.agents.utils.agent_states import AgentState
+
+
+class RecordingLLM:
+    """LLM fake that counts `bind_tools` calls and records each rendered prompt."""
+
+    def __init__(self) -> None:
+        self.bind_calls = 0
+        self.prompts: list[ChatPromptValue] = []
+
+    def bind_tools(self, tools: list[Any]) -> RunnableLambda:
+        self.bind_calls += 1
+
+        def _respond(prompt_value: ChatPromptValue) -> AIMessage:
+            self.prompts.append(prompt_value)
+            return AIMessage(content="report")
+
+        return RunnableLambda(_respond)
+
+
+def _state(ticker: str, trade_date: str) -> AgentState:
+    return AgentState(
+        messages=[HumanMessage(content=ticker)], company_of_interest=ticker, trade_date=trade_date
+    )
+
+
+def test_analyst_node_binds_tools_once_and_formats_per_call_fields() -> None:
+    llm = RecordingLLM()
+    node = make_analyst_node("market", "market_analyst", "market_report", llm)
+
+    first = node(_state("AAPL", "2024-05-10"))
+    second = node(_state("MSFT", "2024-06-14"))
+
+    assert llm.bind_calls == 1
+    assert first["market_report"] == "report"
+    assert second["market_report"] == "report"
+
+    first_text = "\n".join(str(m.content) for m in llm.prompts[0].to_messages())
+    second_text = "\n".join(str(m.content) for m in llm.prompts[1].to_messages())
+    assert "2024-05-10" in first_text
+    assert "AAPL" in first_text
+    assert "2024-06-14" in second_text
+    assert "MSFT" in second_text
+    assert "get_stock_data" in first_text
+
+
+def test_analyst_node_leaves_report_empty_while_calling_tools() -> None:
+    class ToolCallingLLM:
+        def bind_tools(self, tools: list[Any]) -> RunnableLambda:
+            return RunnableLambda(
+                lambda _input: AIMessage(
+                    content="", tool_calls=[{"name": "get_news", "args": {}, "id": "call-1"}]
+                )
+            )
+
+    node = make_analyst_node(
+        "social", "news_sentiment_analyst", "sentiment_report", ToolCallingLLM()
+    )
+
+    result = node(_state("AAPL", "2024-05-10"))
+
+    assert result["sentiment_report"] == ""
+    assert result["messages"][0].tool_calls
+
+
+def test_analyst_prompt_keeps_per_run_fields_out_of_static_prefix() -> None:
+    llm = RecordingLLM()
+    node = make_analyst_node("market", "market_analyst", "market_report", llm)
+
+    node(_state("AAPL", "2024-05-10"))
+    node(_state("MSFT", "2024-06-14"))
+
+    first_static, first_context = llm.prompts[0].to_messages()[:2]
+    second_static, second_context = llm.prompts[1].to_messages()[:2]
+    assert first_static.content == second_static.content
+    assert "AAPL" not in str(first_static.content)
+    assert "2024-05-10" in str(first_context.content)
+    assert "MSFT" in str(second_context.content)
+
+
+def test_static_system_message_marks_anthropic_cache_breakpoint() -> None:
+    anthropic = ChatAnthropic(model_name="claude-test", api_key="test", timeout=None, stop=None)
+
+    cached = _static_system_message("static", anthropic)
+    plain = _static_system_message("static", RecordingLLM())
+
+    assert cached.content == [
+        {"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert plain.content == "static"
+
+
+def _use_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, skip_after_final: bool
+) -> None:
+    config = TradingAgentsConfig(
+        results_dir=tmp_path,
+        llm_provider="google_genai",
+        deep_think_llm="stub",
+        quick_think_llm="stub",
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        max_recur_limit=30,
+        skip_analysts_after_final_proposal=skip_after_final,
+    )
+    monkeypatch.setattr(
+        config_module, "_active_config", ContextVar("test_active_config", default=config)
+    )
+
+
+def test_analyst_node_skips_llm_after_final_proposal_when_enabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _use_config(tmp_path, monkeypatch, skip_after_final=True)
+    llm = RecordingLLM()
+    node = make_analyst_node("news", "news_analyst", "news_report", llm)
+    state = AgentState(
+        messages=[AIMessage(content="Plan...\nFINAL TRANSACTION PROPOSAL: **BUY**")],
+        company_of_interest="AAPL",
+        trade_date="2024-05-10",
+    )
+
+    result = node(state)
+
+    assert result == {"messages": []}
+    assert llm.prompts == []
+
+
+def test_analyst_node_short_circuit_is_off_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _use_config(tmp_path, monkeypatch, skip_after_final=False)
+    llm = RecordingLLM()
+    node = make_analyst_node("news", "news_analyst", "news_report", llm)
+    state = AgentState(
+        messages=[AIMessage(content="FINAL TRANSACTION PROPOSAL: **BUY**")],
+        company_of_interest="AAPL",
+        trade_date="2024-05-10",
+    )
+
+    result = node(state)
+
+    assert TradingAgentsConfig.model_fields["skip_analysts_after_final_proposal"].default is False
+    assert result["news_report"] == "report"
+    assert len(llm.prompts) == 1
+
+
+def test_stray_proposal_in_tool_result_does_not_blank_report(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _use_config(tmp_path, monkeypatch, skip_after_final=True)
+    llm = RecordingLLM()
+    node = make_analyst_node("news", "news_analyst", "news_report", llm)
+    state = AgentState(
+        messages=[
+            HumanMessage(content="AAPL"),
+            ToolMessage(
+                content="Headline: analyst says FINAL TRANSACTION PROPOSAL: BUY",
+                tool_call_id="call-1",
+            ),
+        ],
+        company_of_interest="AAPL",
+        trade_date="2024-05-10",
+    )
+
+    result = node(state)
+
+    assert result["news_report"] == "report"
+    assert len(llm.prompts) == 1
+
+
+def test_analyst_node_joins_text_blocks_into_report() -> None:
+    class BlockLLM:
+        def bind_tools(self, tools: list[Any]) -> RunnableLambda:
+            return RunnableLambda(
+                lambda _input: AIMessage(
+                    content=[
+                        {"type": "thinking", "thinking": "scratchpad"},
+                        {"type": "text", "text": "Trend is "},
+                        {"type": "text", "text": "up."},
+                    ]
+                )
+            )
+
+    node = make_analyst_node("market", "market_analyst", "market_report", BlockLLM())
+
+    result = node(_state("AAPL", "2024-05-10"))
+
+    assert result["market_report"] == "Trend is up."
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("Plan\nFINAL TRANSACTION PROPOSAL: **SELL**", True),
+        ("final transaction proposal : hold", True),
+        ([{"type": "text", "text": "FINAL TRANSACTION PROPOSAL: BUY"}], True),
+        (
+            [
+                {"type": "thinking", "thinking": "FINAL TRANSACTION PROPOSAL: SELL"},
+                {"type": "text", "text": "Still gathering data."},
+            ],
+            False,
+        ),
+        (["Plan", {"type": "text", "text": "FINAL TRANSACTION PROPOSAL: **HOLD**"}], True),
+        ("We will issue a FINAL TRANSACTION PROPOSAL later.", False),
+        ("Continue", False),
+    ],
+)
+def test_has_final_proposal_matches_canonical_variants(
+    content: str | list[dict[str, str]], expected: bool
+) -> None:
+    assert _has_final_proposal([AIMessage(content=content)]) is expected
+
+
+def test_analyst_nodes_reuse_tool_binding_for_same_llm() -> None:
+    llm = RecordingLLM()
+
+    make_analyst_node("market", "market_analyst", "market_report", llm)
+    make_analyst_node("market", "market_analyst", "market_report", llm)
+    make_analyst_node("news", "news_analyst", "news_report", llm)
+
+    assert llm.bind_calls == 2
+
+
+def test_has_final_proposal_ignores_tool_messages() -> None:
+    message = ToolMessage(content="FINAL TRANSACTION PROPOSAL: **BUY**", tool_call_id="call-1")
+
+    assert _has_final_proposal([message]) is False
@@ -1,7 +1,9 @@
-from types import SimpleNamespace
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import pytest
@@ -110,6 +112,22 @@ def test_get_fundamentals_returns_no_data_sentinel_when_info_missing(
     assert result.startswith("[NO_DATA]")
 
 
+def test_get_fundamentals_snapshot_lists_present_fields_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    info = {"longName": "Apple Inc.", "trailingPE": 28.5, "marketCap": 3_000_000_000_000}
+    monkeypatch.setattr(
+        yfinance_data, "_resolve_ticker_info", lambda ticker: ("AAPL", info, ["AAPL"])
+    )
+
+    result = yfinance_data.get_fundamentals("AAPL")
+
+    assert (
+        "Name: Apple Inc.\nMarket Cap: 3.00T (3,000,000,000,000)\nPE Ratio (TTM): 28.5" in result
+    )
+    assert "Sector" not in result
+
+
 @pytest.mark.parametrize(
     ("function_name", "expected_header"),
     [
@@ -323,9 +341,7 @@ def test_stock_stats_bulk_multi_continues_after_candidate_load_exception(
             "Volume": [100, 120],
         })
 
-    monkeypatch.setattr(
-        yfinance_data, "get_config", lambda: SimpleNamespace(data_cache_dir=tmp_path)
-    )
+    monkeypatch.setattr(yfinance_data, "get_cache_dir", lambda: tmp_path)
     monkeypatch.setattr(
         yfinance_data, "get_yfinance_symbol_candidates", lambda symbol: ["BAD", "GOOD"]
     )
@@ -341,6 +357,193 @@ def test_stock_stats_bulk_multi_continues_after_candidate_load_exception(
     assert n_bars == 2
 
 
+def test_load_history_candidate_writes_cache_in_background(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    downloaded = pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        "Close": [1.3, 1.4],
+        "Volume": [100, 120],
+    })
+    monkeypatch.setattr(yfinance_data, "_download_history", lambda *args: downloaded)
+    data_file = tmp_path / f"AAPL-YFin-data{yfinance_data._HISTORY_CACHE_SUFFIX}"
+
+    result = yfinance_data._load_history_candidate(
+        "AAPL",
+        data_file,
+        "2024-01-01",
+        "2024-01-04",
+        start_dt=datetime(2024, 1, 2),
+        last_required_dt=datetime(2024, 1, 3),
+        fresh=False,
+    )
+    yfinance_data.flush_history_cache_writes()
+
+    assert result is downloaded
+    assert list(tmp_path.iterdir()) == [data_file]
+    cached = yfinance_data._read_cached_history(data_file)
+    assert cached["Close"].tolist() == [1.3, 1.4]
+    assert pd.api.types.is_datetime64_dtype(cached["Date"])
+
+
+def test_history_cache_directory_is_created_by_writer_only(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "data_cache"
+    monkeypatch.setattr(yfinance_data, "get_cache_dir", lambda: cache_dir)
+    monkeypatch.setattr(yfinance_data, "get_yfinance_symbol_candidates", lambda symbol: ["AAPL"])
+    monkeypatch.setattr(
+        yfinance_data,
+        "_download_history",
+        lambda *args: pd.DataFrame({"Date": pd.to_datetime(["2024-01-02"]), "Close": [1.0]}),
+    )
+    yfinance_data.clear_history_cache()
+
+    yfinance_data._resolve_history_with_cache("AAPL", datetime(2024, 1, 2))
+    yfinance_data.flush_history_cache_writes()
+    yfinance_data.clear_history_cache()
+
+    assert [p.name for p in cache_dir.iterdir()] == [
+        f"AAPL-YFin-data{yfinance_data._HISTORY_CACHE_SUFFIX}"
+    ]
+
+
+def test_close_on_or_before_locates_bar_in_unsorted_history(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    history = pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-04", "2024-01-02", "2024-01-08", "2024-01-05"]),
+        "Close": [4.0, 2.0, 8.0, 5.0],
+    })
+    monkeypatch.setattr(yfinance_data, "get_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(yfinance_data, "get_yfinance_symbol_candidates", lambda symbol: ["AAPL"])
+    monkeypatch.setattr(yfinance_data, "_load_history_candidate", lambda *args, **kwargs: history)
+    yfinance_data.clear_history_cache()
+
+    assert yfinance_data._close_on_or_before("AAPL", datetime(2024, 1, 6)) == 5.0
+    assert yfinance_data._close_on_or_before("AAPL", datetime(2024, 1, 1)) is None
+    yfinance_data.clear_history_cache()
+
+
+def test_legacy_csv_cache_is_reused_and_migrated(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    legacy = tmp_path / "AAPL-YFin-data.csv"
+    pd.DataFrame({"Date": ["2024-01-02", "2024-01-03"], "Close": [1.3, 1.4]}).to_csv(
+        legacy, index=False
+    )
+    writes: list[Path] = []
+    monkeypatch.setattr(yfinance_data, "_HISTORY_CACHE_SUFFIX", ".parquet")
+    monkeypatch.setattr(
+        yfinance_data, "_write_cached_history", lambda data_file, data: writes.append(data_file)
+    )
+    monkeypatch.setattr(yfinance_data, "_download_history", lambda *args: pytest.fail("download"))
+
+    data_file = yfinance_data._history_cache_file(tmp_path, "AAPL")
+    result = yfinance_data._load_history_candidate(
+        "AAPL",
+        data_file,
+        "2024-01-01",
+        "2024-01-04",
+        start_dt=datetime(2024, 1, 2),
+        last_required_dt=datetime(2024, 1, 3),
+        fresh=True,
+    )
+    yfinance_data.flush_history_cache_writes()
+
+    assert data_file == legacy
+    assert result["Close"].tolist() == [1.3, 1.4]
+    assert writes == [tmp_path / "AAPL-YFin-data.parquet"]
+
+
+@pytest.mark.parametrize(("anchor_close", "expect_full"), [(1.4, False), (0.7, True)])
+def test_stale_cache_downloads_only_missing_tail(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, anchor_close: float, expect_full: bool
+) -> None:
+    data_file = tmp_path / f"AAPL-YFin-data{yfinance_data._HISTORY_CACHE_SUFFIX}"
+    yfinance_data._write_cached_history(
+        data_file,
+        pd.DataFrame({
+            "Date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]),
+            "Close": [1.3, 1.4, 1.45],
+        }),
+    )
+    full = pd.DataFrame({"Date": pd.to_datetime(["2024-01-02"]), "Close": [9.9]})
+    requests: list[str] = []
+
+    def fake_download(candidate: str, start_date: str, end_date: str) -> pd.DataFrame:
+        requests.append(start_date)
+        if start_date != "2024-01-03":
+            return full
+        return pd.DataFrame({
+            "Date": pd.to_datetime(["2024-01-03", "2024-01-04", "2024-01-05"]),
+            "Open": [1.0, 1.0, 1.0],
+            "Close": [anchor_close, 1.5, 1.6],
+        })
+
+    monkeypatch.setattr(yfinance_data, "_download_history", fake_download)
+
+    result = yfinance_data._load_history_candidate(
+        "AAPL",
+        data_file,
+        "2024-01-02",
+        "2024-01-06",
+        start_dt=datetime(2024, 1, 2),
+        last_required_dt=datetime(2024, 1, 5),
+        fresh=False,
+    )
+    yfinance_data.flush_history_cache_writes()
+
+    if expect_full:
+        assert requests == ["2024-01-03", "2024-01-02"]
+        assert result is full
+    else:
+        assert requests == ["2024-01-03"]
+        assert result.columns.tolist() == ["Date", "Close"]
+        assert result["Close"].tolist() == [1.3, 1.4, 1.5, 1.6]
+        assert yfinance_data._read_cached_history(data_file)["Close"].tolist() == [
+            1.3,
+            1.4,
+            1.5,
+            1.6,
+        ]
+
+
+def test_cache_past_curr_date_is_reused_without_download(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    data_file = tmp_path / f"AAPL-YFin-data{yfinance_data._HISTORY_CACHE_SUFFIX}"
+    cached = pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]),
+        "Close": [1.3, 1.4, 1.45, 1.5],
+    })
+    yfinance_data._write_cached_history(data_file, cached)
+    requests: list[tuple[str, str]] = []
+
+    def fake_download(candidate: str, start_date: str, end_date: str) -> pd.DataFrame:
+        requests.append((start_date, end_date))
+        return pd.DataFrame()
+
+    monkeypatch.setattr(yfinance_data, "_download_history", fake_download)
+
+    result = yfinance_data._load_history_candidate(
+        "AAPL",
+        data_file,
+        "2024-01-02",
+        "2024-01-04",
+        start_dt=datetime(2024, 1, 2),
+        last_required_dt=datetime(2024, 1, 3),
+        fresh=False,
+    )
+    extended = yfinance_data._extend_cached_history(
+        "AAPL", cached, datetime(2024, 1, 2), "2024-01-04"
+    )
+
+    assert requests == []
+    assert result["Close"].tolist() == [1.3, 1.4, 1.45, 1.5]
+    assert extended.empty
+
+
 def test_normalize_freq_rejects_unknown_values() -> None:
     with pytest.raises(ValueError, match="quarterly"):
         _normalize_freq("monthly")
@@ -491,3 +694,301 @@ def test_get_global_news_yfinance_returns_tool_error_sentinel(
 
     assert result.startswith("[TOOL_ERROR]")
     assert "search down" in result
+
+
+def test_stock_stats_bulk_multi_formats_only_requested_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dates = pd.bdate_range("2023-01-02", periods=300)
+    closes = [100.0 + i for i in range(len(dates))]
+    history = pd.DataFrame({
+        "Date": dates,
+        "Open": closes,
+        "High": [c + 1 for c in closes],
+        "Low": [c - 1 for c in closes],
+        "Close": closes,
+        "Volume": [1_000] * len(dates),
+    })
+    monkeypatch.setattr(
+        yfinance_data,
+        "_resolve_history_with_cache",
+        lambda symbol, dt: (symbol, history, [symbol]),
+    )
+
+    _, full_map, n_bars = yfinance_data._get_stock_stats_bulk_multi(
+        "AAPL", ["close_50_sma"], "2024-01-05"
+    )
+    _, window_map, _ = yfinance_data._get_stock_stats_bulk_multi(
+        "AAPL", ["close_50_sma"], "2024-01-05", window_start="2024-01-01"
+    )
+
+    assert n_bars == int((dates <= "2024-01-05").sum())
+    assert max(full_map["close_50_sma"]) == "2024-01-05"
+    assert list(window_map["close_50_sma"]) == [
+        "2024-01-01",
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-04",
+        "2024-01-05",
+    ]
+    assert all(full_map["close_50_sma"][d] == v for d, v in window_map["close_50_sma"].items())
+    expected = history.set_index("Date")["Close"].rolling(50).mean()[pd.Timestamp("2024-01-05")]
+    assert window_map["close_50_sma"]["2024-01-05"] == str(expected)
+
+
+def test_stock_stats_indicators_batch_collapses_duplicate_indicators(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[list[str]] = []
+
+    def fake_bulk(
+        symbol: str, indicators: list[str], curr_date: str, *, window_start: str | None = None
+    ) -> tuple[str, dict[str, dict[str, str]], int]:
+        requested.append(indicators)
+        return symbol, {ind: {curr_date: "1.0"} for ind in indicators}, 300
+
+    monkeypatch.setattr(yfinance_data, "_get_stock_stats_bulk_multi", fake_bulk)
+
+    report = yfinance_data.get_stock_stats_indicators_batch(
+        "AAPL", ["macd", "rsi", "macd"], "2024-01-05", 5
+    )
+
+    assert requested == [["macd", "rsi"]]
+    assert report.count("## macd values") == 1
+
+
+def test_format_indicator_section_orders_dates_chronologically() -> None:
+    in_order = {"2024-01-02": "1.0", "2024-01-03": "2.0", "2024-01-04": "3.0"}
+    shuffled = {"2024-01-04": "3.0", "2024-01-02": "1.0", "2023-12-29": "0.5", "2024-01-03": "2.0"}
+
+    expected = yfinance_data._format_indicator_section("rsi", in_order, "2024-01-01", "2024-01-05")
+    reordered = yfinance_data._format_indicator_section(
+        "rsi", shuffled, "2024-01-01", "2024-01-05"
+    )
+
+    assert reordered == expected
+    assert "2024-01-02: 1.0\n2024-01-03: 2.0\n2024-01-04: 3.0\n" in expected
+
+
+def test_retrieved_at_reuses_format_within_one_second(monkeypatch: pytest.MonkeyPatch) -> None:
+    epoch = datetime(2024, 5, 10, 9, 30, 15).timestamp()
+    monkeypatch.setattr(yfinance_data.time, "time", lambda: epoch + 0.25)
+    yfinance_data._format_epoch_second.cache_clear()
+
+    first = yfinance_data._retrieved_at()
+    monkeypatch.setattr(yfinance_data.time, "time", lambda: epoch + 0.75)
+    second = yfinance_data._retrieved_at()
+    monkeypatch.setattr(yfinance_data.time, "time", lambda: epoch + 1.0)
+    rolled = yfinance_data._retrieved_at()
+
+    assert first == second == "2024-05-10 09:30:15"
+    assert rolled == "2024-05-10 09:30:16"
+    assert yfinance_data._format_epoch_second.cache_info().hits == 1
+
+
+def test_get_news_yfinance_formats_article_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    published = datetime(2024, 1, 1, 9, 30)
+    articles = [
+        {
+            "title": "First",
+            "publisher": "Wire",
+            "summary": "Beat estimates.",
+            "link": "https://example.com/1",
+            "providerPublishTime": int(published.timestamp()),
+        },
+        {
+            "title": "Second",
+            "publisher": "Desk",
+            "providerPublishTime": int(published.timestamp()),
+        },
+    ]
+    monkeypatch.setattr(
+        news, "_get_first_ticker_news", lambda ticker: ("AAPL", articles, ["AAPL"])
+    )
+
+    result = news.get_news_yfinance("AAPL", "2024-01-01", "2024-01-01")
+
+    assert result == (
+        "## AAPL News (yfinance), from 2024-01-01 to 2024-01-01:\n\n"
+        "### First (source: Wire)\nPublished: 2024-01-01 09:30:00\nBeat estimates.\n"
+        "Link: https://example.com/1\n\n"
+        "### Second (source: Desk)\nPublished: 2024-01-01 09:30:00\n\n"
+    )
+
+
+def test_fetch_news_keeps_only_sources_with_article_blocks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(news, "get_news_yfinance", lambda *args: "\n  ## yf articles")
+    monkeypatch.setattr(news, "get_news_google_rss", lambda *args: "[NO_DATA] nothing")
+
+    assert news.fetch_news("AAPL", "2024-01-01", "2024-01-02") == "\n  ## yf articles"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("2024-05-10", datetime(2024, 5, 10)), ("2024-5-1", datetime(2024, 5, 1))],
+)
+def test_parse_yyyy_mm_dd_accepts_padded_and_unpadded_dates(
+    value: str, expected: datetime
+) -> None:
+    assert yfinance_data._parse_yyyy_mm_dd(value, "curr_date") == expected
+
+
+@pytest.mark.parametrize("value", ["2024-02-30", "2024/05/10", "2024-05-10T00:00", ""])
+def test_parse_yyyy_mm_dd_rejects_invalid_dates(value: str) -> None:
+    with pytest.raises(ValueError, match="curr_date must be in YYYY-MM-DD format"):
+        yfinance_data._parse_yyyy_mm_dd(value, "curr_date")
+
+
+def test_resolve_history_reuses_in_memory_frame(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    loads: list[str] = []
+
+    def fake_load_history_candidate(  # noqa: PLR0913 -- mirrors signature under test
+        candidate: str,
+        data_file: Path,
+        start_date: str,
+        end_date: str,
+        *,
+        start_dt: datetime,
+        last_required_dt: datetime,
+        fresh: bool,
+    ) -> pd.DataFrame:
+        loads.append(candidate)
+        return pd.DataFrame({"Date": pd.to_datetime(["2024-01-02"]), "Close": [1.0]})
+
+    monkeypatch.setattr(yfinance_data, "get_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(yfinance_data, "get_yfinance_symbol_candidates", lambda symbol: ["AAPL"])
+    monkeypatch.setattr(yfinance_data, "_load_history_candidate", fake_load_history_candidate)
+    yfinance_data.clear_history_cache()
+
+    first = yfinance_data._resolve_history_with_cache("AAPL", datetime(2024, 1, 2))
+    second = yfinance_data._resolve_history_with_cache("AAPL", datetime(2024, 1, 2))
+    yfinance_data._resolve_history_with_cache("AAPL", datetime(2024, 1, 3))
+
+    assert loads == ["AAPL", "AAPL"]
+    assert first == ("AAPL", first[1], ("AAPL",))
+    assert second is first
+    yfinance_data.clear_history_cache()
+
+
+def test_concurrent_history_lookups_share_one_fetch(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    release = threading.Event()
+    loads: list[str] = []
+
+    def slow_load(*args: object, **kwargs: object) -> pd.DataFrame:
+        loads.append(str(args[0]))
+        release.wait(timeout=5)
+        return pd.DataFrame({"Date": pd.to_datetime(["2024-01-02"]), "Close": [1.0]})
+
+    monkeypatch.setattr(yfinance_data, "get_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(yfinance_data, "get_yfinance_symbol_candidates", lambda symbol: ["AAPL"])
+    monkeypatch.setattr(yfinance_data, "_load_history_candidate", slow_load)
+    yfinance_data.clear_history_cache()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(
+                yfinance_data._resolve_history_with_cache, "AAPL", datetime(2024, 1, 2)
+            )
+            for _ in range(4)
+        ]
+        while not loads:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        frames = [future.result()[1] for future in futures]
+
+    assert loads == ["AAPL"]
+    assert all(frame is frames[0] for frame in frames)
+    yfinance_data.clear_history_cache()
+
+
+def test_historical_date_check_rolls_over_with_the_calendar_day() -> None:
+    today = datetime.now().date()
+    yesterday = (today - timedelta(days=1)).isoformat()
+
+    assert yfinance_data._is_historical_date(yesterday)
+    assert not yfinance_data._is_historical_date(today.isoformat())
+    assert not yfinance_data._is_historical_date(None)
+    assert not yfinance_data._is_before_day(today.isoformat(), today.toordinal())
+    assert yfinance_data._is_before_day(today.isoformat(), today.toordinal() + 1)
+
+
+def test_stock_stats_reuses_wrapped_history_per_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    history = pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=5),
+        "Open": [1.0, 1.1, 1.2, 1.3, 1.4],
+        "High": [1.5, 1.6, 1.7, 1.8, 1.9],
+        "Low": [0.9, 1.0, 1.1, 1.2, 1.3],
+        "Close": [1.2, 1.3, 1.4, 1.5, 1.6],
+        "Volume": [100, 110, 120, 130, 140],
+    })
+    wrap_calls: list[int] = []
+    real_wrap = yfinance_data.wrap
+
+    def counting_wrap(df: pd.DataFrame) -> pd.DataFrame:
+        wrap_calls.append(len(df))
+        return real_wrap(df)
+
+    monkeypatch.setattr(yfinance_data, "wrap", counting_wrap)
+    monkeypatch.setattr(
+        yfinance_data,
+        "_resolve_history_with_cache",
+        lambda symbol, curr_date_dt: ("AAPL", history, ("AAPL",)),
+    )
+    yfinance_data.clear_history_cache()
+
+    yfinance_data._get_stock_stats_bulk_multi("AAPL", ["close_10_ema"], "2024-01-04")
+    _, data_map, _ = yfinance_data._get_stock_stats_bulk_multi("AAPL", ["rsi"], "2024-01-04")
+    yfinance_data._get_stock_stats_bulk_multi("AAPL", ["rsi"], "2024-01-05")
+    yfinance_data.clear_history_cache()
+
+    assert wrap_calls == [4, 5]
+    assert "2024-01-05" not in data_map["rsi"]
+
+
+def test_stock_stats_wraps_only_ohlcv_columns() -> None:
+    history = pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=3),
+        "Open": [1.0, 1.1, 1.2],
+        "High": [1.5, 1.6, 1.7],
+        "Low": [0.9, 1.0, 1.1],
+        "Close": [1.2, 1.3, 1.4],
+        "Volume": [100, 110, 120],
+        "Dividends": [0.0, 0.0, 0.0],
+        "Stock Splits": [0.0, 0.0, 0.0],
+    })
+
+    wrapped, _ = yfinance_data._wrapped_history("AAPL", history, 2)
+    yfinance_data.clear_history_cache()
+
+    assert {"dividends", "stock splits", "Dividends", "Stock Splits"}.isdisjoint(wrapped.columns)
+    assert {"open", "high", "low", "close", "volume"}.issubset(wrapped.columns)
+    assert len(wrapped) == 2
+
+
+def test_wrapped_history_is_rebuilt_for_a_new_frame_under_the_same_key() -> None:
+    def history(close: float) -> pd.DataFrame:
+        return pd.DataFrame({
+            "Date": pd.date_range("2024-01-01", periods=2),
+            "Open": [1.0, 1.0],
+            "High": [2.0, 2.0],
+            "Low": [0.5, 0.5],
+            "Close": [close, close],
+            "Volume": [100, 100],
+        })
+
+    first_frame = history(1.0)
+    first, _ = yfinance_data._wrapped_history("AAPL", first_frame, 2)
+    again, _ = yfinance_data._wrapped_history("AAPL", first_frame, 2)
+    refreshed, _ = yfinance_data._wrapped_history("AAPL", history(1.5), 2)
+    yfinance_data.clear_history_cache()
+
+    assert again is first
+    assert refreshed is not first
+    assert refreshed["close"].tolist() == [1.5, 1.5]
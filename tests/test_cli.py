@@ -0,0 +1,53 @@
+from typing import Any
+import logging
+from collections.abc import Callable
+
+import pytest
+from rich.console import Console, RenderResult, ConsoleOptions
+
+from tradingagents.interface import cli as cli_module
+from tradingagents.graph.signal_processing import TradeRecommendation
+
+
+class _UnrenderablePanel:
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        raise RuntimeError("panel failed to render")
+
+
+class _BrokenRenderer:
+    def __init__(self, emit: Callable[[Any], None]) -> None:
+        self.emit = emit
+
+    def __call__(self, message: object) -> None:
+        self.emit(_UnrenderablePanel())
+
+
+class _FinishedGraph:
+    def __init__(self, **_kwargs: object) -> None:
+        pass
+
+    def propagate(
+        self, company_name: str, trade_date: str, on_message: Callable[[object], None]
+    ) -> tuple[dict[str, Any], TradeRecommendation]:
+        on_message(object())
+        return {}, TradeRecommendation(signal="BUY")
+
+
+def test_run_cli_keeps_a_finished_run_when_a_panel_fails_to_render(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setattr(cli_module, "TradingAgentsGraph", _FinishedGraph)
+    monkeypatch.setattr(cli_module, "MessageRenderer", _BrokenRenderer)
+
+    with caplog.at_level(logging.WARNING, logger="tradingagents.interface.display"):
+        recommendation = cli_module.run_cli(ticker="AAPL", date="2024-05-10")
+
+    assert recommendation.signal == "BUY"
+    assert "BUY" in capsys.readouterr().out
+    assert any(
+        "panel failed to render" in str(record.exc_info[1])
+        for record in caplog.records
+        if record.exc_info
+    )
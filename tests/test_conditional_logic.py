@@ -1,6 +1,7 @@
 import pytest
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage
 
+from tradingagents.graph.setup import SUPPORTED_ANALYSTS
 from tradingagents.graph.conditional_logic import ConditionalLogic
 from tradingagents.agents.utils.agent_states import AgentState, RiskDebateState, InvestDebateState
 
@@ -32,6 +33,15 @@ def test_analyst_routing_uses_tool_calls_to_continue_or_clear(
 
     assert method(with_tool) == tools_node
     assert method(without_tool) == clear_node
+    assert method(AgentState(messages=[HumanMessage(content="Continue")])) == clear_node
+
+
+def test_analyst_routers_cover_every_supported_analyst() -> None:
+    logic = ConditionalLogic(max_debate_rounds=2, max_risk_discuss_rounds=2)
+
+    assert set(logic.analyst_routers) == set(SUPPORTED_ANALYSTS)
+    assert logic.analyst_routers is logic.analyst_routers
+    assert logic.analyst_routers["news"] == logic.should_continue_news
 
 
 def test_investment_debate_routes_to_research_manager_at_cutoff() -> None:
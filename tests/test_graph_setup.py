@@ -0,0 +1,155 @@
+import json
+from typing import Any
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+
+from tradingagents.graph import setup as graph_setup_module
+from tradingagents.graph import trading_graph as trading_graph_module
+from tradingagents.config import TradingAgentsConfig
+from tradingagents.backtest import StubChatModel
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.agents.utils.agent_states import AgentState
+
+
+def _stub_graph(tmp_path: Path, *, parallel_analysts: bool) -> TradingAgentsGraph:
+    config = TradingAgentsConfig(
+        results_dir=tmp_path,
+        llm_provider="google_genai",
+        deep_think_llm="stub",
+        quick_think_llm="stub",
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        max_recur_limit=30,
+        parallel_analysts=parallel_analysts,
+    )
+    graph = TradingAgentsGraph(config=config)
+    graph.__dict__["quick_thinking_llm"] = StubChatModel()
+    graph.__dict__["deep_thinking_llm"] = StubChatModel()
+    return graph
+
+
+def test_parallel_analysts_fan_out_from_start(tmp_path: Path) -> None:
+    graph = _stub_graph(tmp_path, parallel_analysts=True)
+
+    edges = graph.graph.get_graph().edges
+    start_targets = {edge.target for edge in edges if edge.source == "__start__"}
+
+    assert start_targets == {
+        "Market Analyst",
+        "Social Analyst",
+        "News Analyst",
+        "Fundamentals Analyst",
+    }
+
+
+def test_parallel_analysts_skip_msg_clear_nodes(tmp_path: Path) -> None:
+    graph = _stub_graph(tmp_path, parallel_analysts=True)
+
+    nodes = graph.graph.get_graph().nodes
+
+    assert not [name for name in nodes if name.startswith("Msg Clear")]
+
+
+@pytest.mark.parametrize("parallel_analysts", [False, True])
+def test_stub_run_fills_every_report(tmp_path: Path, parallel_analysts: bool) -> None:
+    graph = _stub_graph(tmp_path, parallel_analysts=parallel_analysts)
+
+    state, recommendation = graph.propagate("AAPL", "2024-05-10")
+
+    assert state.market_report
+    assert state.sentiment_report
+    assert state.news_report
+    assert state.fundamentals_report
+    assert state.situation_summary
+    assert recommendation.signal == "BUY"
+
+
+def test_fork_rebuilds_memories_and_workflow_but_shares_clients(tmp_path: Path) -> None:
+    base = _stub_graph(tmp_path, parallel_analysts=False)
+    base_workflow = base.graph
+    base.trader_memory.add_situations([("base situation", "base lesson")])
+
+    forked = base.fork()
+    forked.trader_memory.add_situations([("fork situation", "fork lesson")])
+
+    assert forked.graph is not base_workflow
+    assert forked.trader_memory is not base.trader_memory
+    assert base.trader_memory.recommendations == ["base lesson"]
+    assert forked.trader_memory.recommendations == ["base lesson", "fork lesson"]
+    assert forked.quick_thinking_llm is base.quick_thinking_llm
+    assert forked.tool_nodes is base.tool_nodes
+
+
+def test_graph_builds_one_client_when_quick_and_deep_models_match(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    built: list[str] = []
+
+    def fake_build_chat_model(provider: str, model: str, **_kwargs: object) -> StubChatModel:
+        built.append(model)
+        return StubChatModel()
+
+    monkeypatch.setattr(trading_graph_module, "build_chat_model", fake_build_chat_model)
+    config = TradingAgentsConfig(
+        results_dir=tmp_path,
+        llm_provider="google_genai",
+        deep_think_llm="stub",
+        quick_think_llm="stub",
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        max_recur_limit=30,
+    )
+    graph = TradingAgentsGraph(config=config)
+
+    assert graph.quick_thinking_llm is graph.deep_thinking_llm
+    assert built == ["stub"]
+
+
+def test_graph_build_loads_every_persisted_memory(tmp_path: Path) -> None:
+    graph = _stub_graph(tmp_path, parallel_analysts=False)
+    memory_dir = graph.config.data_cache_dir / "memories"
+    memory_dir.mkdir(parents=True)
+    names = (
+        "bull_memory",
+        "bear_memory",
+        "trader_memory",
+        "invest_judge_memory",
+        "risk_manager_memory",
+    )
+    for name in names:
+        record = {"situation": f"{name} situation", "recommendation": f"{name} lesson"}
+        (memory_dir / f"{name}.jsonl").write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+    assert graph.graph is not None
+
+    for name in names:
+        assert getattr(graph, name).recommendations == [f"{name} lesson"]
+
+
+def test_parallel_propagate_delivers_every_report_to_summariser(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: list[AgentState] = []
+    real_factory = graph_setup_module.create_situation_summariser
+
+    def recording_factory(llm: object) -> Callable[[AgentState], dict[str, Any]]:
+        node = real_factory(llm)
+
+        def summariser(state: AgentState) -> dict[str, Any]:
+            seen.append(state)
+            return node(state)
+
+        return summariser
+
+    monkeypatch.setattr(graph_setup_module, "create_situation_summariser", recording_factory)
+    graph = _stub_graph(tmp_path, parallel_analysts=True)
+
+    graph.propagate("AAPL", "2024-05-10")
+
+    assert len(seen) == 1
+    assert seen[0].market_report
+    assert seen[0].sentiment_report
+    assert seen[0].news_report
+    assert seen[0].fundamentals_report
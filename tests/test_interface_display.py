@@ -1,9 +1,18 @@
+import io
 from typing import Any
+import threading
 
+import pytest
 from rich.console import Console, RenderableType
-from langchain_core.messages import AIMessage, ToolMessage, HumanMessage
+from langchain_core.messages import (
+    AIMessage,
+    ChatMessage,
+    ToolMessage,
+    HumanMessage,
+    AIMessageChunk,
+)
 
-from tradingagents.interface.display import MessageRenderer
+from tradingagents.interface.display import MessageRenderer, BackgroundEmitter
 
 
 def _render_to_text(renderables: list[RenderableType]) -> str:
@@ -88,3 +97,117 @@ def test_content_to_renderable_flattens_text_blocks() -> None:
     output = _render_to_text(emitted)
     assert "chunk one" in output
     assert "chunk two" in output
+
+
+def test_message_renderer_dispatches_subclasses_and_unknown_types() -> None:
+    emitted: list[RenderableType] = []
+    renderer = MessageRenderer(emit=emitted.append)
+
+    renderer.render(AIMessageChunk(content="streamed reply"))
+    renderer.render(ChatMessage(content="custom role", role="critic"))
+
+    output = _render_to_text(emitted)
+    assert "AI" in output
+    assert "streamed reply" in output
+    assert "chat" in output
+    assert "custom role" in output
+
+
+def test_content_to_renderable_returns_none_for_empty_payloads() -> None:
+    assert MessageRenderer._content_to_renderable(None) is None
+    assert MessageRenderer._content_to_renderable("") is None
+    assert MessageRenderer._content_to_renderable([]) is None
+    assert MessageRenderer._content_to_renderable("  \n ") is None
+
+
+def test_background_emitter_preserves_order_and_flushes_on_exit() -> None:
+    emitted: list[tuple[RenderableType, str]] = []
+
+    def record(renderable: RenderableType) -> None:
+        emitted.append((renderable, threading.current_thread().name))
+
+    with BackgroundEmitter(target=record) as emit:
+        for index in range(50):
+            emit(f"panel {index}")
+
+    assert [renderable for renderable, _ in emitted] == [f"panel {i}" for i in range(50)]
+    assert {thread for _, thread in emitted} == {"tradingagents-render"}
+
+
+def test_background_emitter_survives_a_failing_target() -> None:
+    emitted: list[RenderableType] = []
+
+    def flaky(renderable: RenderableType) -> None:
+        if renderable == "boom":
+            raise RuntimeError("terminal closed")
+        emitted.append(renderable)
+
+    emitter = BackgroundEmitter(target=flaky)
+    emitter("first")
+    emitter("boom")
+    emitter("last")
+    with pytest.raises(RuntimeError, match="terminal closed"):
+        emitter.close()
+
+    assert emitted == ["first", "last"]
+    emitter.close()
+
+
+def test_background_emitter_does_not_mask_the_run_error() -> None:
+    def broken(renderable: RenderableType) -> None:
+        raise RuntimeError("terminal closed")
+
+    def run() -> None:
+        with BackgroundEmitter(target=broken) as emit:
+            emit("panel")
+            raise ValueError("graph failed")
+
+    with pytest.raises(ValueError, match="graph failed"):
+        run()
+
+
+def test_background_emitter_writes_a_queued_backlog_in_one_flush() -> None:
+    class CountingFile(io.StringIO):
+        writes = 0
+
+        def write(self, text: str) -> int:
+            self.writes += 1
+            return super().write(text)
+
+    output = CountingFile()
+    emitter = BackgroundEmitter.for_console(Console(file=output, width=80))
+    for index in range(10):
+        emitter._queue.put(f"panel {index}")
+    emitter("panel 10")
+    emitter.close()
+
+    assert output.getvalue().splitlines() == [f"panel {i}" for i in range(11)]
+    # The pre-queued backlog is one flush; the final panel may race into it.
+    assert output.writes <= 2
+
+
+def test_tool_text_truncation_boundary() -> None:
+    exact = "\n".join(f"line-{i}" for i in range(40))
+    one_over = exact + "\nline-40"
+
+    kept = MessageRenderer._tool_content_to_renderable(exact)
+    cut = MessageRenderer._tool_content_to_renderable(one_over)
+
+    assert str(kept) == exact
+    assert str(cut) == exact + "\n... [1 more lines truncated]"
+
+
+def test_background_emitter_keeps_a_buffered_batch_when_one_item_fails() -> None:
+    class Broken:
+        def __rich_console__(self, console: Console, options: object) -> Any:  # noqa: ANN401
+            raise RuntimeError("bad panel")
+
+    output = io.StringIO()
+    emitter = BackgroundEmitter.for_console(Console(file=output, width=80))
+    emitter._queue.put("panel 0")
+    emitter._queue.put(Broken())
+    emitter("panel 2")
+    with pytest.raises(RuntimeError, match="bad panel"):
+        emitter.close()
+
+    assert output.getvalue().splitlines() == ["panel 0", "panel 2"]
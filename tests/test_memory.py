@@ -77,3 +77,52 @@ def test_memory_get_memories_returns_empty_when_uninitialized() -> None:
     memory = FinancialSituationMemory(name="empty")
 
     assert memory.get_memories("anything", n_matches=3) == []
+
+
+def test_memory_get_memories_breaks_ties_by_insertion_order() -> None:
+    memory = FinancialSituationMemory(name="ties")
+    memory.add_situations([
+        ("crude oil supply shock", "First oil lesson"),
+        ("treasury yields curve inversion", "Rates lesson"),
+        ("crude oil supply shock", "Second oil lesson"),
+        ("semiconductor export controls", "Chips lesson"),
+        ("consumer credit card delinquencies", "Credit lesson"),
+    ])
+
+    matches = memory.get_memories("crude oil supply", n_matches=2)
+
+    assert [match["recommendation"] for match in matches] == [
+        "First oil lesson",
+        "Second oil lesson",
+    ]
+
+
+def test_memory_appends_batches_and_recovers_from_torn_line(tmp_path: Path) -> None:
+    storage_path = tmp_path / "bull.jsonl"
+    memory = FinancialSituationMemory(name="bull", storage_path=storage_path)
+    memory.add_situations([("first situation", "First lesson.")])
+    # Simulate a crash that left a half-written record without a newline.
+    with storage_path.open("a", encoding="utf-8") as fp:
+        fp.write('{"situation": "torn')
+
+    memory.add_situations([("second situation", "Second lesson.")])
+
+    reloaded = FinancialSituationMemory(name="bull", storage_path=storage_path)
+    assert reloaded.recommendations == ["First lesson.", "Second lesson."]
+
+
+def test_memory_rewrites_file_when_stored_lines_do_not_match(tmp_path: Path) -> None:
+    storage_path = tmp_path / "trader.jsonl"
+    memory = FinancialSituationMemory(name="trader", storage_path=storage_path)
+    memory.add_situations([("first situation", "First lesson."), ("second", "Second lesson.")])
+    # Another process truncated the file behind this instance's back.
+    storage_path.write_text("", encoding="utf-8")
+
+    memory.add_situations([("third situation", "Third lesson.")])
+
+    lines = storage_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["recommendation"] for line in lines] == [
+        "First lesson.",
+        "Second lesson.",
+        "Third lesson.",
+    ]
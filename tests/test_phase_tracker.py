@@ -0,0 +1,64 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from tradingagents.agents.utils.agent_states import AgentState, InvestDebateState
+from tradingagents.interface.tui.phase_tracker import _filled, derive_phases, phase_signature
+
+
+def _derive(state: AgentState | None) -> list[str]:
+    phases = derive_phases(
+        state, selected_analysts=["market", "news"], max_debate_rounds=2, max_risk_discuss_rounds=2
+    )
+    return [f"{phase.id}:{phase.status}:{phase.progress}" for phase in phases]
+
+
+def test_phase_signature_ignores_message_only_updates() -> None:
+    before = AgentState(messages=[HumanMessage(content="AAPL")], company_of_interest="AAPL")
+    after = before.model_copy(
+        update={"messages": [*before.messages, AIMessage(content="Calling tools.")]}
+    )
+
+    assert phase_signature(before) == phase_signature(after)
+    assert _derive(before) == _derive(after)
+
+
+def test_phase_signature_changes_when_a_phase_changes() -> None:
+    base = AgentState(company_of_interest="AAPL")
+    reported = base.model_copy(update={"market_report": "Trend is up."})
+    debated = reported.model_copy(update={"investment_debate_state": InvestDebateState(count=1)})
+
+    assert phase_signature(base) != phase_signature(reported)
+    assert phase_signature(reported) != phase_signature(debated)
+    assert _derive(reported) != _derive(debated)
+
+
+def test_derive_phases_marks_finished_analysts_and_promotes_next() -> None:
+    state = AgentState(company_of_interest="AAPL", market_report="Trend is up.")
+
+    assert _derive(state)[:3] == [
+        "phase-market:done:",
+        "phase-news:running:",
+        "phase-situation-summary:pending:",
+    ]
+    assert _derive(None)[0] == "phase-market:running:"
+
+
+def test_phase_signature_tracks_judge_decision_and_final_decision() -> None:
+    base = AgentState(company_of_interest="AAPL")
+    judged = base.model_copy(
+        update={"investment_debate_state": InvestDebateState(judge_decision="BUY")}
+    )
+    final = base.model_copy(update={"final_trade_decision": "FINAL TRANSACTION PROPOSAL: HOLD"})
+
+    signatures = {phase_signature(state) for state in (base, judged, final)}
+
+    assert len(signatures) == 3
+    assert phase_signature(base) == (0, 0, 0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, False), ("", False), ("  \n\t", False), ("report", True), ("\n  report  ", True)],
+)
+def test_filled_requires_non_whitespace_text(value: str | None, expected: bool) -> None:
+    assert _filled(value) is expected
@@ -0,0 +1,45 @@
+from pathlib import Path
+from contextvars import ContextVar
+
+import pytest
+
+from tradingagents import config as config_module
+from tradingagents.config import TradingAgentsConfig
+from tradingagents.agents.prompts import load_prompt, _read_template
+
+
+def _use_language(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, language: str) -> None:
+    config = TradingAgentsConfig(
+        results_dir=tmp_path,
+        llm_provider="google_genai",
+        deep_think_llm="stub",
+        quick_think_llm="stub",
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        max_recur_limit=30,
+        response_language=language,
+    )
+    monkeypatch.setattr(
+        config_module, "_active_config", ContextVar("test_active_config", default=config)
+    )
+
+
+def test_load_prompt_reads_template_once_but_follows_language(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _read_template.cache_clear()
+
+    _use_language(monkeypatch, tmp_path, "ja-JP")
+    japanese = load_prompt("trader_system")
+    _use_language(monkeypatch, tmp_path, "de-DE")
+    german = load_prompt("trader_system")
+
+    assert japanese.endswith("Please respond in ja-JP.")
+    assert german.endswith("Please respond in de-DE.")
+    assert "{{require_canonical_signal}}" not in german
+    assert _read_template.cache_info().misses == 1
+
+
+def test_load_prompt_missing_file_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        load_prompt("does_not_exist")
@@ -1,5 +1,16 @@
+from pathlib import Path
+import contextvars
+
 import pytest
+from pydantic import ValidationError
 
+from tradingagents.config import (
+    TradingAgentsConfig,
+    get_config,
+    set_config,
+    peek_config,
+    get_cache_dir,
+)
 from tradingagents.graph.setup import GraphSetup
 from tradingagents.interface.cli import _normalize_trade_date, _normalize_selected_analysts
 from tradingagents.graph.trading_graph import _safe_path_component
@@ -24,3 +35,31 @@ def test_graph_setup_deduplicates_selected_analysts() -> None:
 
 def test_safe_path_component_blocks_path_traversal() -> None:
     assert _safe_path_component("../AAPL/../../x") == "AAPL_.._.._x"
+
+
+def test_config_is_frozen_and_shared_without_copy(tmp_path: Path) -> None:
+    config = TradingAgentsConfig(
+        results_dir=tmp_path,
+        llm_provider="google_genai",
+        deep_think_llm="stub",
+        quick_think_llm="stub",
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        max_recur_limit=30,
+    )
+
+    with pytest.raises(ValidationError, match="frozen"):
+        config.max_debate_rounds = 2
+    context = contextvars.copy_context()
+    context.run(set_config, config)
+    assert context.run(get_config) is config
+    assert context.run(get_cache_dir) == tmp_path / "data_cache"
+    assert hash(config) == hash(config.model_copy())
+
+
+def test_peek_config_returns_none_instead_of_raising() -> None:
+    context = contextvars.Context()
+
+    assert context.run(peek_config) is None
+    with pytest.raises(RuntimeError, match="has not been initialized"):
+        context.run(get_config)
@@ -0,0 +1,113 @@
+from pathlib import Path
+from contextvars import ContextVar
+
+import pytest
+
+from tradingagents import config as config_module
+from tradingagents.config import TradingAgentsConfig
+from tradingagents.agents.utils import core_stock_tools
+from tradingagents.agents.utils.tool_cache import tool_value_cache, clear_tool_value_caches
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    clear_tool_value_caches()
+
+
+def test_tool_value_cache_reuses_identical_calls() -> None:
+    calls: list[tuple[str, str]] = []
+
+    @tool_value_cache(as_of_arg="curr_date")
+    def lookup(symbol: str, curr_date: str, indicators: list[str] | None = None) -> str:
+        calls.append((symbol, curr_date))
+        return f"{symbol}@{curr_date}"
+
+    assert lookup("AAPL", "2024-05-10", ["macd"]) == "AAPL@2024-05-10"
+    assert lookup(symbol="AAPL", curr_date="2024-05-10", indicators=["macd"]) == "AAPL@2024-05-10"
+    assert lookup("AAPL", "2024-05-13", ["macd"]) == "AAPL@2024-05-13"
+
+    assert calls == [("AAPL", "2024-05-10"), ("AAPL", "2024-05-13")]
+
+
+def test_tool_value_cache_skips_tool_errors() -> None:
+    calls = 0
+
+    @tool_value_cache(as_of_arg="curr_date")
+    def flaky(curr_date: str) -> str:
+        nonlocal calls
+        calls += 1
+        return "[TOOL_ERROR] upstream timeout"
+
+    flaky("2024-05-10")
+    flaky("2024-05-10")
+
+    assert calls == 2
+
+
+def test_get_stock_data_tool_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    def fake_online(symbol: str, start_date: str, end_date: str) -> str:
+        nonlocal calls
+        calls += 1
+        return f"csv for {symbol}"
+
+    monkeypatch.setattr(core_stock_tools, "get_yfin_data_online", fake_online)
+    args = {"symbol": "AAPL", "start_date": "2024-04-01", "end_date": "2024-05-10"}
+
+    first = core_stock_tools.get_stock_data.invoke(args)
+    second = core_stock_tools.get_stock_data.invoke(args)
+
+    assert first == second == "csv for AAPL"
+    assert calls == 1
+
+
+def test_tool_value_cache_keys_defaults_and_rejects_bad_calls() -> None:
+    calls: list[str | None] = []
+
+    def lookup(symbol: str, curr_date: str, indicators: list[str] | None = None) -> str:
+        calls.append(curr_date)
+        return symbol
+
+    cached = tool_value_cache(as_of_arg="curr_date")(lookup)
+
+    cached("AAPL", "2024-05-10")
+    cached("AAPL", curr_date="2024-05-10", indicators=None)
+    with pytest.raises(TypeError):
+        cached("AAPL", symbol="MSFT", curr_date="2024-05-10")
+    with pytest.raises(TypeError):
+        cached("AAPL", "2024-05-10", bogus=1)
+
+    assert calls == ["2024-05-10"]
+    assert tool_value_cache(as_of_arg="curr_date")(cached) is cached
+
+
+def test_tool_value_cache_is_scoped_to_the_active_cache_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    active: ContextVar[TradingAgentsConfig | None] = ContextVar("test_active_config", default=None)
+    monkeypatch.setattr(config_module, "_active_config", active)
+    calls: list[str] = []
+
+    @tool_value_cache(as_of_arg="curr_date")
+    def lookup(symbol: str, curr_date: str) -> str:
+        calls.append(str(active.get().results_dir.name))
+        return f"{symbol} from {calls[-1]}"
+
+    results = []
+    for name in ("first", "second", "first"):
+        active.set(
+            TradingAgentsConfig(
+                results_dir=tmp_path / name,
+                llm_provider="google_genai",
+                deep_think_llm="stub",
+                quick_think_llm="stub",
+                max_debate_rounds=1,
+                max_risk_discuss_rounds=1,
+                max_recur_limit=30,
+            )
+        )
+        results.append(lookup("AAPL", "2024-05-10"))
+
+    assert results == ["AAPL from first", "AAPL from second", "AAPL from first"]
+    assert calls == ["first", "second"]
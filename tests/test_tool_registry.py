@@ -10,7 +10,7 @@ from langchain_core.runnables import RunnableLambda
 from tradingagents.config import TradingAgentsConfig
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.agents.utils.agent_states import AgentState
-from tradingagents.agents.utils.tool_registry import ANALYST_TOOL_REGISTRY
+from tradingagents.agents.utils.tool_registry import ANALYST_TOOL_REGISTRY, get_analyst_tool_names
 from tradingagents.agents.analysts.news_analyst import create_news_analyst
 from tradingagents.agents.analysts.market_analyst import create_market_analyst
 from tradingagents.agents.analysts.fundamentals_analyst import create_fundamentals_analyst
@@ -95,3 +95,8 @@ def test_prompt_tool_mentions_match_registry(analyst_type: str, prompt_name: str
     mentioned = sorted(set(_TOOL_CALL_PATTERN.findall(text)))
 
     assert mentioned == sorted(_tool_names(analyst_type))
+
+
+@pytest.mark.parametrize("analyst_type", list(ANALYST_TOOL_REGISTRY))
+def test_analyst_tool_names_follow_registry_order(analyst_type: str) -> None:
+    assert get_analyst_tool_names(analyst_type) == ", ".join(_tool_names(analyst_type))
@@ -1,10 +1,13 @@
+import json
 from pathlib import Path
 from collections.abc import Iterator
 
-from langchain_core.messages import AIMessage, ToolMessage, HumanMessage
+from langchain_core.messages import AIMessage, AnyMessage, ToolMessage, HumanMessage
+from langgraph.graph.message import add_messages
 
 from tradingagents.config import TradingAgentsConfig
 from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.agents.utils.agent_utils import create_msg_delete
 from tradingagents.agents.utils.agent_states import AgentState
 
 
@@ -74,3 +77,79 @@ def test_propagate_can_return_collected_messages(tmp_path: Path) -> None:
         "Need market data.",
         '{"close": 195.12}',
     ]
+
+
+def test_propagate_collects_messages_across_msg_clear(tmp_path: Path) -> None:
+    clear = create_msg_delete()
+
+    def _state(messages: list[AnyMessage], **extra: str) -> AgentState:
+        return AgentState(
+            messages=messages, company_of_interest="AAPL", trade_date="2024-05-10", **extra
+        )
+
+    def _cleared(messages: list[AnyMessage]) -> list[AnyMessage]:
+        return add_messages(messages, clear(_state(messages))["messages"])
+
+    human = HumanMessage(content="AAPL", id="h1")
+    market = [human, AIMessage(content="Market report.", id="a1")]
+    after_market = _cleared(market)
+    news = [*after_market, AIMessage(content="News report.", id="a2")]
+    after_news = _cleared(news)
+    final = [*after_news, AIMessage(content="Fundamentals report.", id="a3")]
+    ta = TradingAgentsGraph(debug=False, config=_config(tmp_path))
+    ta.__dict__["graph"] = FakeGraph([
+        _state([human]),
+        _state(market),
+        _state(after_market),
+        _state(news),
+        _state(after_news),
+        _state(final, final_trade_decision=_final_trade_decision()),
+    ])
+
+    _, _, messages = ta.propagate(
+        company_name="AAPL", trade_date="2024-05-10", return_messages=True
+    )
+
+    assert [message.content for message in messages] == [
+        "AAPL",
+        "Market report.",
+        "Continue",
+        "News report.",
+        "Continue",
+        "Fundamentals report.",
+    ]
+    assert after_market[0].id != after_news[0].id
+
+
+def test_propagate_writes_state_and_conversation_logs(tmp_path: Path) -> None:
+    _graph_with_messages(tmp_path).propagate(company_name="AAPL", trade_date="2024-05-10")
+
+    ticker_dir = tmp_path / "AAPL"
+    state_log = json.loads(
+        (ticker_dir / "full_states_log_AAPL_2024-05-10.json").read_text(encoding="utf-8")
+    )
+    conversation_text = (ticker_dir / "conversation_log_AAPL_2024-05-10.json").read_text(
+        encoding="utf-8"
+    )
+    conversation = json.loads(conversation_text)
+    assert state_log["runs"]["2024-05-10"]["company_of_interest"] == "AAPL"
+    assert len(conversation) == 3
+    assert conversation_text == json.dumps(conversation, indent=2, ensure_ascii=False)
+    assert "Need market data." in (ticker_dir / "conversation_log_AAPL_2024-05-10.txt").read_text(
+        encoding="utf-8"
+    )
+    assert not list(ticker_dir.glob("*.tmp"))
+
+
+def test_state_log_reflects_entries_edited_in_place(tmp_path: Path) -> None:
+    ta = _graph_with_messages(tmp_path)
+    ta.propagate(company_name="AAPL", trade_date="2024-05-10")
+    ta.log_states_dict["2024-05-10"]["market_report"] = "edited"
+
+    ta.propagate(company_name="AAPL", trade_date="2024-05-13")
+
+    state_log = json.loads(
+        (tmp_path / "AAPL" / "full_states_log_AAPL_2024-05-13.json").read_text(encoding="utf-8")
+    )
+    assert state_log["runs"]["2024-05-10"]["market_report"] == "edited"
+    assert set(state_log["runs"]) == {"2024-05-10", "2024-05-13"}